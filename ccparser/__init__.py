@@ -19,10 +19,16 @@ from .parser import (
     InvalidExpiryDateError,
     InvalidCVVError,
 )
-from .generator import generate_card_number
-from .validator import validate_card_number, validate_expiry_date, validate_cvv
+from .generator import generate_card_number, generate_card_numbers
+from .validator import (
+    validate_card,
+    validate_card_number,
+    validate_card_numbers,
+    validate_expiry_date,
+    validate_cvv,
+)
 from .formatter import format_card_number, mask_card_number
-from .utils import detect_card_type, get_card_details
+from .utils import detect_card_type, get_card_details, clear_bin_cache, prune_bin_cache
 
 __version__ = "1.0.0"
 __author__ = "Vihanga Indusara"
@@ -38,8 +44,11 @@ __all__ = [
     "InvalidCVVError",
     # Generator
     "generate_card_number",
+    "generate_card_numbers",
     # Validators
+    "validate_card",
     "validate_card_number",
+    "validate_card_numbers",
     "validate_expiry_date",
     "validate_cvv",
     # Formatters
@@ -48,4 +57,6 @@ __all__ = [
     # Utilities
     "detect_card_type",
     "get_card_details",
+    "clear_bin_cache",
+    "prune_bin_cache",
 ]
@@ -5,20 +5,213 @@ Usage:
     ccparser "4111111111111111|12|2030|123"
     ccparser --masked "4111111111111111|12|2030|123"
     ccparser --json "4111111111111111|12|2030|123"
+    ccparser --batch cards.txt
 """
 
 import argparse
 import json
+import multiprocessing
+import os
+import stat
 import sys
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 from . import __version__
 from .parser import CCParser, CCParserError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
-def main() -> int:
+
+def _dumps(obj: dict, indent: bool = True) -> str:
+    """
+    Serialize a dictionary as JSON.
+
+    Uses orjson when installed (pip install ccparser[fast]), otherwise the
+    standard library json module, configured to match orjson's output
+    (including writing non-ASCII characters unescaped).
+
+    Args:
+        obj: The dictionary to serialize.
+        indent: Indent by 2 spaces if True, otherwise write a single compact
+            line (as used for JSON Lines batch output).
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None).decode()
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+# Files smaller than this per worker are not worth a process pool
+_MIN_CHUNK_BYTES = 1 << 20
+
+
+def _chunk_bounds(path: str, parts: int) -> List[Tuple[int, int]]:
+    """
+    Split a file into up to parts byte ranges that each end on a line boundary.
+
+    Args:
+        path: Path to the file.
+        parts: The maximum number of ranges.
+
+    Returns:
+        A list of (start, end) byte offsets covering the whole file.
+    """
+    size = os.path.getsize(path)
+    bounds = []
+    start = 0
+    with open(path, "rb") as f:
+        for i in range(1, parts):
+            target = size * i // parts
+            if target <= start:
+                continue
+            # Move on to the end of the line containing the target offset
+            f.seek(target)
+            f.readline()
+            end = f.tell()
+            if end >= size:
+                break
+            bounds.append((start, end))
+            start = end
+    if start < size:
+        bounds.append((start, size))
+    return bounds
+
+
+def _process_chunk(task: Tuple[str, int, int, bool, bool, bool]) -> Tuple[List[str], bool]:
+    """
+    Parse and validate every card string in one byte range of a batch file.
+
+    Args:
+        task: A (path, start, end, masked, json_output, quiet) tuple.
+
+    Returns:
+        A (lines, all_valid) tuple with one output line per non-blank input
+        line, or none in quiet mode, and whether every card string was valid.
+    """
+    path, start, end, masked, json_output, quiet = task
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    card_strings = data.decode("utf-8").splitlines()
+    if quiet:
+        # Only validity matters, so stop at the first invalid card string
+        return [], _all_valid(card_strings)
+
+    lines = []
+    all_valid = True
+    for line, is_valid in _batch_results(card_strings, masked, json_output):
+        lines.append(line)
+        all_valid = all_valid and is_valid
+    return lines, all_valid
+
+
+def _stream_batch(
+    card_strings: Iterable[str], masked: bool, json_output: bool, quiet: bool
+) -> bool:
+    """
+    Parse and validate card strings one at a time, printing each result as it is ready.
+
+    Returns:
+        Whether every card string was valid.
+    """
+    if quiet:
+        return _all_valid(card_strings)
+
+    all_valid = True
+    for line, is_valid in _batch_results(card_strings, masked, json_output):
+        print(line)
+        all_valid = all_valid and is_valid
+    return all_valid
+
+
+def _all_valid(card_strings: Iterable[str]) -> bool:
+    """Check that every non-blank card string is valid, stopping at the first that is not."""
+    return all(
+        CCParser.is_valid_only(card_string)
+        for card_string in card_strings
+        if card_string.strip()
+    )
+
+
+def _batch_results(
+    card_strings: Iterable[str], masked: bool, json_output: bool
+) -> Iterator[Tuple[str, bool]]:
+    """
+    Parse and validate card strings, skipping blank ones.
+
+    Yields:
+        An (output line, is_valid) tuple for each non-blank card string.
+    """
+    for card_string in card_strings:
+        if not card_string.strip():
+            continue
+        try:
+            card = CCParser(card_string)
+        except CCParserError as e:
+            yield (_dumps({"error": str(e)}, indent=False) if json_output else f"Error: {e}"), False
+            continue
+
+        is_valid = card.is_valid()
+        if json_output:
+            output = card.to_dict()
+            if masked:
+                output['number'] = output['masked_number']
+            yield _dumps(output, indent=False), is_valid
+        else:
+            number = card.masked_number if masked else card.formatted_number
+            yield f"{number}\t{card.get_expiry()}\t{card.card_type}\t{is_valid}", is_valid
+
+
+def _run_batch(path: str, jobs: int, masked: bool, json_output: bool, quiet: bool) -> int:
+    """
+    Parse and validate a file of card strings, one per line.
+
+    Large files are split into line-aligned chunks that are processed in
+    parallel by a pool of worker processes. Pipes and other non-regular
+    files, such as /dev/stdin, are read line by line in this process.
+
+    Returns:
+        Exit code (0 if every card string is valid, 1 otherwise).
+    """
+    if not stat.S_ISREG(os.stat(path).st_mode):
+        # A pipe has no size to split by, and can only be read once
+        with open(path, encoding="utf-8") as f:
+            return 0 if _stream_batch(f, masked, json_output, quiet) else 1
+
+    size = os.path.getsize(path)
+    parts = max(1, min(jobs, size // _MIN_CHUNK_BYTES))
+    tasks = [
+        (path, start, end, masked, json_output, quiet)
+        for start, end in _chunk_bounds(path, parts)
+    ]
+
+    if len(tasks) > 1:
+        with multiprocessing.Pool(len(tasks)) as pool:
+            results = pool.map(_process_chunk, tasks)
+    else:
+        results = [_process_chunk(task) for task in tasks]
+
+    all_valid = True
+    for lines, chunk_valid in results:
+        all_valid = all_valid and chunk_valid
+        if lines:
+            print("\n".join(lines))
+    return 0 if all_valid else 1
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     """
     Main entry point for the CCParser CLI.
 
+    Args:
+        argv: Command-line arguments, excluding the program name
+            (default: sys.argv[1:]).
+
     Returns:
         Exit code (0 for success, 1 for error).
     """
@@ -30,9 +223,23 @@ def main() -> int:
 
     parser.add_argument(
         "card_string",
+        nargs="?",
         help="Credit card string to parse (format: NUMBER|MM|YYYY|CVV or NUMBER|MM/YY|CVV)"
     )
 
+    parser.add_argument(
+        "-b", "--batch",
+        metavar="FILE",
+        help="Parse a file of card strings, one per line, printing one result per line"
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes for --batch (default: number of CPUs)"
+    )
+
     parser.add_argument(
         "-m", "--masked",
         action="store_true",
@@ -58,21 +265,34 @@ def main() -> int:
         version=f"%(prog)s {__version__}"
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+
+    if args.batch is not None:
+        if args.card_string is not None:
+            parser.error("card_string cannot be combined with --batch")
+        try:
+            return _run_batch(args.batch, args.jobs, args.masked, args.json_output, args.quiet)
+        except (OSError, UnicodeDecodeError) as e:
+            if not args.quiet:
+                print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+    if args.card_string is None:
+        parser.error("the following arguments are required: card_string")
+
+    # Quiet mode - just validate and exit
+    if args.quiet:
+        return 0 if CCParser.is_valid_only(args.card_string) else 1
 
     try:
         card = CCParser(args.card_string)
 
-        # Quiet mode - just validate and exit
-        if args.quiet:
-            return 0 if card.is_valid() else 1
-
         # JSON output
         if args.json_output:
             output = card.to_dict()
             if args.masked:
                 output['number'] = output['masked_number']
-            print(json.dumps(output, indent=2))
+            print(_dumps(output))
             return 0
 
         # Standard output
@@ -89,19 +309,15 @@ def main() -> int:
         return 0 if card.is_valid() else 1
 
     except CCParserError as e:
-        if args.quiet:
-            return 1
         if args.json_output:
-            print(json.dumps({"error": str(e)}, indent=2))
+            print(_dumps({"error": str(e)}))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
 
     except Exception as e:
-        if args.quiet:
-            return 1
         if args.json_output:
-            print(json.dumps({"error": f"Unexpected error: {e}"}), indent=2)
+            print(_dumps({"error": f"Unexpected error: {e}"}))
         else:
             print(f"Unexpected error: {e}", file=sys.stderr)
         return 1
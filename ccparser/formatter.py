@@ -5,6 +5,42 @@ This module provides functions to format and mask credit card numbers
 for display purposes.
 """
 
+from .utils import _strip_non_digits
+
+
+def _build_mask_template(length: int, visible_digits: int) -> str:
+    """
+    Build a str.format template that masks a card number in groups of 4.
+
+    The template takes the visible digits as its only argument; each masked
+    position is a '*' and each visible position indexes into the argument.
+    """
+    masked_length = length - visible_digits
+    groups = []
+    for i in range(0, length, 4):
+        groups.append("".join(
+            "*" if j < masked_length else f"{{0[{j - masked_length}]}}"
+            for j in range(i, min(i + 4, length))
+        ))
+    return " ".join(groups)
+
+
+# Fixed masked prefixes for the common card lengths, followed by the
+# visible digits as-is whatever their count
+_CARD_MASK_PREFIXES = {
+    15: "**** ****** *",  # AMEX format: 4-6-5 with last 4 visible (1 masked in last group)
+    14: "**** ****** ",  # Diners Club format: 4-6-4 with last 4 visible
+    16: "**** **** **** ",  # Standard 16-digit format
+}
+
+# Precomputed templates for other lengths keyed by (length, visible_digits)
+_MASK_TEMPLATES = {
+    (length, visible_digits): _build_mask_template(length, visible_digits)
+    for length in range(12, 20)
+    if length not in _CARD_MASK_PREFIXES
+    for visible_digits in (2, 4, 6)
+}
+
 
 def format_card_number(card_number: str, separator: str = " ") -> str:
     """
@@ -30,18 +66,27 @@ def format_card_number(card_number: str, separator: str = " ") -> str:
         return ""
 
     # Clean any existing formatting
-    clean_number = "".join(c for c in card_number if c.isdigit())
+    if card_number.isdecimal():
+        clean_number = card_number
+    else:
+        clean_number = _strip_non_digits(card_number)
 
-    # AMEX format: 4-6-5
-    if len(clean_number) == 15:
-        return f"{clean_number[:4]}{separator}{clean_number[4:10]}{separator}{clean_number[10:]}"
+    length = len(clean_number)
+
+    # Most common case: 16 digits in four groups of 4
+    if length == 16:
+        return (
+            f"{clean_number[:4]}{separator}{clean_number[4:8]}{separator}"
+            f"{clean_number[8:12]}{separator}{clean_number[12:]}"
+        )
 
+    # AMEX format: 4-6-5
     # Diners Club format: 4-6-4
-    if len(clean_number) == 14:
+    if length == 15 or length == 14:
         return f"{clean_number[:4]}{separator}{clean_number[4:10]}{separator}{clean_number[10:]}"
 
     # Standard format: groups of 4
-    return separator.join(clean_number[i:i+4] for i in range(0, len(clean_number), 4))
+    return separator.join(clean_number[i:i+4] for i in range(0, length, 4))
 
 
 def mask_card_number(card_number: str, visible_digits: int = 4) -> str:
@@ -70,41 +115,21 @@ def mask_card_number(card_number: str, visible_digits: int = 4) -> str:
         return ""
 
     # Clean any existing formatting
-    clean_number = "".join(c for c in card_number if c.isdigit())
+    if card_number.isdecimal():
+        clean_number = card_number
+    else:
+        clean_number = _strip_non_digits(card_number)
     length = len(clean_number)
 
     if length < visible_digits:
         return clean_number
 
-    # Get the visible portion
-    visible_part = clean_number[-visible_digits:]
-
-    # AMEX format: 4-6-5 with last 4 visible (1 masked in last group)
-    if length == 15:
-        return f"**** ****** *{visible_part}"
+    prefix = _CARD_MASK_PREFIXES.get(length)
+    if prefix is not None:
+        return prefix + clean_number[-visible_digits:]
 
-    # Diners Club format: 4-6-4 with last 4 visible
-    if length == 14:
-        return f"**** ****** {visible_part}"
+    template = _MASK_TEMPLATES.get((length, visible_digits))
+    if template is None:
+        template = _build_mask_template(length, visible_digits)
 
-    # Standard 16-digit format
-    if length == 16:
-        return f"**** **** **** {visible_part}"
-
-    # Generic fallback for other lengths
-    masked_length = length - visible_digits
-    masked_groups = []
-    remaining_masked = masked_length
-
-    for i in range(0, length, 4):
-        group_size = min(4, length - i)
-        if remaining_masked >= group_size:
-            masked_groups.append("*" * group_size)
-            remaining_masked -= group_size
-        elif remaining_masked > 0:
-            masked_groups.append("*" * remaining_masked + clean_number[i + remaining_masked:i + group_size])
-            remaining_masked = 0
-        else:
-            masked_groups.append(clean_number[i:i + group_size])
-
-    return " ".join(masked_groups)
+    return template.format(clean_number[-visible_digits:])
@@ -9,6 +9,8 @@ never be used for actual transactions.
 import random
 from typing import List, Optional
 
+from .validator import luhn_check_digit
+
 # Card type prefixes and their corresponding IIN ranges
 CARD_PREFIXES = {
     "Visa": ["4"],
@@ -60,25 +62,54 @@ def generate_card_number(card_type: str, seed: Optional[int] = None) -> str:
         >>> generate_card_number("AMEX")
         '378282246310005'
     """
+    return generate_card_numbers(card_type, 1, seed)[0]
+
+
+def generate_card_numbers(card_type: str, count: int, seed: Optional[int] = None) -> List[str]:
+    """
+    Generate several valid test credit card numbers for the specified card type.
+
+    This is the bulk form of generate_card_number(): the card type is
+    validated and its prefixes and length resolved once for the whole batch.
+
+    Args:
+        card_type: The type of credit card to generate.
+        count: The number of card numbers to generate.
+        seed: Optional random seed for reproducible generation.
+
+    Returns:
+        A list of count card number strings that pass Luhn validation.
+
+    Raises:
+        ValueError: If the card type is not supported or count is negative.
+
+    Example:
+        >>> len(generate_card_numbers("Visa", 3))
+        3
+    """
     if card_type not in CARD_PREFIXES:
         supported = ", ".join(sorted(CARD_PREFIXES.keys()))
         raise ValueError(f"Unsupported card type: '{card_type}'. Supported types: {supported}")
+    if count < 0:
+        raise ValueError(f"count must be non-negative, got {count}")
 
     if seed is not None:
         random.seed(seed)
 
-    prefix = random.choice(CARD_PREFIXES[card_type])
+    prefixes = CARD_PREFIXES[card_type]
     length = CARD_LENGTHS[card_type]
+    return [_generate(prefixes, length) for _ in range(count)]
+
 
-    # Generate card number without check digit
-    number = prefix
-    while len(number) < length - 1:
-        number += str(random.randint(0, 9))
+def _generate(prefixes: List[str], length: int) -> str:
+    """Generate one Luhn-valid number from a random prefix and random digits."""
+    prefix = random.choice(prefixes)
 
-    # Calculate Luhn check digit
-    check_digit = _calculate_luhn_check_digit(number)
+    # Draw all body digits at once as a single zero-padded random integer
+    body_length = length - 1 - len(prefix)
+    number = f"{prefix}{random.randrange(10 ** body_length):0{body_length}d}"
 
-    return number + str(check_digit)
+    return number + str(_calculate_luhn_check_digit(number))
 
 
 def _calculate_luhn_check_digit(number: str) -> int:
@@ -91,18 +122,7 @@ def _calculate_luhn_check_digit(number: str) -> int:
     Returns:
         The check digit (0-9) that makes the number pass Luhn validation.
     """
-    total = 0
-    reversed_digits = number[::-1]
-
-    for i, digit in enumerate(reversed_digits):
-        digit_value = int(digit)
-        if i % 2 == 0:
-            digit_value *= 2
-            if digit_value > 9:
-                digit_value -= 9
-        total += digit_value
-
-    return (10 - (total % 10)) % 10
+    return luhn_check_digit(number)
 
 
 def get_supported_card_types() -> List[str]:
@@ -5,14 +5,61 @@ This module provides the main CCParser class for parsing, validating,
 and extracting credit card information from strings.
 """
 
-import re
 from typing import Optional
 
-from .validator import validate_card_number, validate_expiry_date, validate_cvv
+from .validator import (
+    MAX_CARD_NUMBER_LENGTH,
+    MIN_CARD_NUMBER_LENGTH,
+    validate_card,
+    validate_card_number,
+    validate_expiry_date,
+    validate_cvv,
+    expected_cvv_length,
+)
 from .formatter import format_card_number, mask_card_number
 from .utils import detect_card_type, get_card_details
 
 
+def _parse_pipe_delimited(card_string: str) -> Optional[tuple[str, str, str, str]]:
+    """
+    Parse the common NUMBER|MM|YY(YY)|CVV format without the general parser.
+
+    Args:
+        card_string: The card string to parse.
+
+    Returns:
+        A tuple of (card_number, expiry_month, expiry_year, cvv), or None if
+        the string is not a well-formed 4-field pipe-delimited card string.
+        The general parser then handles it, including raising errors.
+    """
+    if not card_string.isascii():
+        return None
+
+    fields = card_string.split('|')
+    if len(fields) != 4:
+        return None
+
+    card_number, expiry_month, expiry_year, cvv = fields
+    if not (card_number.isdigit() and expiry_month.isdigit()
+            and expiry_year.isdigit() and cvv.isdigit()):
+        return None
+
+    try:
+        month_int = int(expiry_month)
+    except ValueError:
+        # Too many digits for int() (see sys.set_int_max_str_digits)
+        return None
+    if month_int < 1 or month_int > 12:
+        return None
+
+    if len(expiry_year) == 2:
+        expiry_year = "20" + expiry_year
+    elif len(expiry_year) != 4:
+        return None
+
+    return card_number, f"{month_int:02d}", expiry_year, cvv
+
+
 class CCParserError(Exception):
     """Base exception for all CCParser errors."""
     pass
@@ -52,6 +99,12 @@ class CCParser:
         expiry_month: The expiry month (01-12).
         expiry_year: The expiry year (YYYY format).
         cvv: The CVV/CVC code.
+        card_type: The detected card type (read-only).
+        formatted_number: The card number formatted with spaces (read-only).
+        masked_number: The masked card number (read-only).
+
+    The card type, formatted and masked numbers, and validity are computed
+    once per instance and cached, and recomputed if a field is assigned.
 
     Example:
         >>> card = CCParser("4111111111111111|12|2030|123")
@@ -63,6 +116,18 @@ class CCParser:
         True
     """
 
+    __slots__ = (
+        "card_string",
+        "_card_number",
+        "_expiry_month",
+        "_expiry_year",
+        "_cvv",
+        "_card_type",
+        "_formatted_number",
+        "_masked_number",
+        "_is_valid",
+    )
+
     def __init__(self, card_string: str):
         """
         Initialize CCParser with a card string.
@@ -78,9 +143,17 @@ class CCParser:
             raise InvalidCardNumberError("Card string cannot be empty")
 
         self.card_string = card_string.strip()
-        self.card_number, self.expiry_month, self.expiry_year, self.cvv = self._parse_card_string(self.card_string)
+        (
+            self._card_number, self._expiry_month, self._expiry_year, self._cvv
+        ) = self._parse_card_string(self.card_string)
+
+        self._card_type = detect_card_type(self._card_number)
+        self._formatted_number: Optional[str] = None
+        self._masked_number: Optional[str] = None
+        self._is_valid: Optional[bool] = None
 
-    def _parse_card_string(self, card_string: str) -> tuple[str, str, str, str]:
+    @staticmethod
+    def _parse_card_string(card_string: str) -> tuple[str, str, str, str]:
         """
         Parse the card string into its components.
 
@@ -94,18 +167,18 @@ class CCParser:
             InvalidCardNumberError: If the format is invalid.
             InvalidExpiryDateError: If the expiry date format is invalid.
         """
-        delimiters = r"[|: ]+"
-        parts = [p for p in re.split(delimiters, card_string) if p]
+        parsed = _parse_pipe_delimited(card_string)
+        if parsed is not None:
+            return parsed
+
+        # Turn the field delimiters into spaces so str.split() separates the
+        # fields; two replace() calls beat both str.translate and re.split
+        parts = card_string.replace("|", " ").replace(":", " ").split()
 
         if len(parts) == 3:
             card_number, expiry, cvv = parts
-            if '/' in expiry:
-                expiry_parts = expiry.split('/')
-            elif '-' in expiry:
-                expiry_parts = expiry.split('-')
-            else:
-                raise InvalidExpiryDateError("Invalid expiry date format. Use MM/YY or MM/YYYY")
-
+            # Accept either '/' or '-' between month and year
+            expiry_parts = expiry.replace('-', '/').split('/')
             if len(expiry_parts) != 2:
                 raise InvalidExpiryDateError("Invalid expiry date format. Use MM/YY or MM/YYYY")
 
@@ -133,12 +206,13 @@ class CCParser:
         elif len(expiry_year) != 4:
             raise InvalidExpiryDateError(f"Invalid year: {expiry_year}. Use YY or YYYY format")
 
-        # Validate card number contains only digits
-        if not card_number.isdigit():
+        # Validate card number contains only digits 0-9
+        # (str.isascii is O(1), so this costs no more than isdigit alone)
+        if not (card_number.isascii() and card_number.isdigit()):
             raise InvalidCardNumberError("Card number must contain only digits")
 
-        # Validate CVV contains only digits
-        if not cvv.isdigit():
+        # Validate CVV contains only digits 0-9
+        if not (cvv.isascii() and cvv.isdigit()):
             raise InvalidCVVError("CVV must contain only digits")
 
         return card_number, expiry_month, expiry_year, cvv
@@ -150,7 +224,7 @@ class CCParser:
         Returns:
             The unformatted card number string.
         """
-        return self.card_number
+        return self._card_number
 
     def get_formatted_number(self) -> str:
         """
@@ -159,7 +233,70 @@ class CCParser:
         Returns:
             The card number formatted with spaces (e.g., '4111 1111 1111 1111').
         """
-        return format_card_number(self.card_number)
+        return self.formatted_number
+
+    # Assigning a parsed field clears the cached values derived from it
+    @property
+    def card_number(self) -> str:
+        """The card number, digits only."""
+        return self._card_number
+
+    @card_number.setter
+    def card_number(self, value: str) -> None:
+        self._card_number = value
+        self._card_type = detect_card_type(value)
+        self._formatted_number = None
+        self._masked_number = None
+        self._is_valid = None
+
+    @property
+    def expiry_month(self) -> str:
+        """The 2-digit expiry month (e.g., '12')."""
+        return self._expiry_month
+
+    @expiry_month.setter
+    def expiry_month(self, value: str) -> None:
+        self._expiry_month = value
+        self._is_valid = None
+
+    @property
+    def expiry_year(self) -> str:
+        """The 4-digit expiry year (e.g., '2030')."""
+        return self._expiry_year
+
+    @expiry_year.setter
+    def expiry_year(self, value: str) -> None:
+        self._expiry_year = value
+        self._is_valid = None
+
+    @property
+    def cvv(self) -> str:
+        """The CVV/CVC code."""
+        return self._cvv
+
+    @cvv.setter
+    def cvv(self, value: str) -> None:
+        self._cvv = value
+        self._is_valid = None
+
+    @property
+    def card_type(self) -> str:
+        """The detected card type, or 'Unknown' if not recognized."""
+        return self._card_type
+
+    @property
+    def formatted_number(self) -> str:
+        """The card number formatted with spaces, computed on first access."""
+        if self._formatted_number is None:
+            self._formatted_number = format_card_number(self._card_number)
+        return self._formatted_number
+
+    @property
+    def masked_number(self) -> str:
+        """The card number with all but the last 4 digits masked, computed on first access."""
+        if self._masked_number is None:
+            self._masked_number = mask_card_number(self._card_number)
+        return self._masked_number
 
     def get_expiry(self) -> str:
         """
@@ -168,7 +305,7 @@ class CCParser:
         Returns:
             The expiry date string (e.g., '12/30').
         """
-        return f"{self.expiry_month}/{self.expiry_year[2:]}"
+        return f"{self._expiry_month}/{self._expiry_year[2:]}"
 
     def get_expiry_full(self) -> str:
         """
@@ -177,7 +314,7 @@ class CCParser:
         Returns:
             The full expiry date string (e.g., '12/2030').
         """
-        return f"{self.expiry_month}/{self.expiry_year}"
+        return f"{self._expiry_month}/{self._expiry_year}"
 
     def get_year(self) -> str:
         """
@@ -186,7 +323,7 @@ class CCParser:
         Returns:
             The 4-digit expiry year (e.g., '2030').
         """
-        return self.expiry_year
+        return self._expiry_year
 
     def get_month(self) -> str:
         """
@@ -195,7 +332,7 @@ class CCParser:
         Returns:
             The 2-digit expiry month (e.g., '12').
         """
-        return self.expiry_month
+        return self._expiry_month
 
     def get_cvv(self) -> str:
         """
@@ -204,7 +341,7 @@ class CCParser:
         Returns:
             The CVV/CVC code string.
         """
-        return self.cvv
+        return self._cvv
 
     def is_valid(self) -> bool:
         """
@@ -221,34 +358,68 @@ class CCParser:
             validation failures. Use validate() if you need detailed
             error information.
         """
+        if self._is_valid is None:
+            self._is_valid = self._check_valid()
+        return self._is_valid
+
+    def _check_valid(self) -> bool:
+        """Run all validations, returning False on any failure."""
+        return validate_card(
+            self._card_number, self._expiry_month, self._expiry_year, self._cvv, self._card_type
+        )
+
+    @classmethod
+    def is_valid_only(cls, card_string: str) -> bool:
+        """
+        Check if a card string is valid without creating a CCParser.
+
+        Gives the same result as CCParser(card_string).is_valid(), and False
+        if the string cannot be parsed, but skips building the instance.
+        Use this when only the validity is needed, e.g. for bulk checks.
+
+        Args:
+            card_string: The credit card string to check.
+
+        Returns:
+            True if the string parses and all validations pass, False otherwise.
+
+        Example:
+            >>> CCParser.is_valid_only("4111111111111111|12|2030|123")
+            True
+            >>> CCParser.is_valid_only("not a card")
+            False
+        """
+        if not card_string or not isinstance(card_string, str):
+            return False
         try:
-            if not validate_card_number(self.card_number):
-                return False
-            if not validate_expiry_date(self.expiry_month, self.expiry_year):
-                return False
-            if not validate_cvv(self.cvv, self.card_number):
-                return False
-            return True
-        except Exception:
+            parsed = cls._parse_card_string(card_string.strip())
+        except CCParserError:
             return False
+        return validate_card(*parsed)
 
     def validate(self) -> None:
         """
         Validate the card data and raise exceptions on failure.
 
         Raises:
-            InvalidCardNumberError: If the card number fails Luhn validation.
+            InvalidCardNumberError: If the card number is not 13-19 digits
+                long or fails Luhn validation.
             InvalidExpiryDateError: If the card has expired.
             InvalidCVVError: If the CVV length is incorrect for the card type.
         """
-        if not validate_card_number(self.card_number):
+        length = len(self._card_number)
+        if not MIN_CARD_NUMBER_LENGTH <= length <= MAX_CARD_NUMBER_LENGTH:
+            raise InvalidCardNumberError(
+                f"Invalid card number length: {length} digits. "
+                f"Must be {MIN_CARD_NUMBER_LENGTH}-{MAX_CARD_NUMBER_LENGTH}"
+            )
+        if not validate_card_number(self._card_number):
             raise InvalidCardNumberError("Card number failed Luhn validation")
-        if not validate_expiry_date(self.expiry_month, self.expiry_year):
+        if not validate_expiry_date(self._expiry_month, self._expiry_year):
             raise InvalidExpiryDateError("Card has expired or expiry date is invalid")
-        if not validate_cvv(self.cvv, self.card_number):
-            raise InvalidCVVError(
-                f"Invalid CVV length. Expected {'4' if detect_card_type(self.card_number) == 'AMEX' else '3'} digits"
-            )
+        if not validate_cvv(self._cvv, self._card_number, self._card_type):
+            expected_length = expected_cvv_length(self._card_type)
+            raise InvalidCVVError(f"Invalid CVV length. Expected {expected_length} digits")
 
     def get_card_type(self) -> str:
         """
@@ -258,7 +429,7 @@ class CCParser:
             The card type name (e.g., 'Visa', 'MasterCard', 'AMEX'),
             or 'Unknown' if not recognized.
         """
-        return detect_card_type(self.card_number)
+        return self._card_type
 
     def get_masked_number(self) -> str:
         """
@@ -268,7 +439,7 @@ class CCParser:
             The card number with most digits masked
             (e.g., '**** **** **** 1111').
         """
-        return mask_card_number(self.card_number)
+        return self.masked_number
 
     def get_card_details(self) -> Optional[dict]:
         """
@@ -284,7 +455,7 @@ class CCParser:
         Raises:
             ImportError: If 'requests' is not installed.
         """
-        return get_card_details(self.card_number)
+        return get_card_details(self._card_number)
 
     def to_dict(self) -> dict:
         """
@@ -294,14 +465,14 @@ class CCParser:
             A dictionary containing all card information.
         """
         return {
-            'number': self.card_number,
-            'formatted_number': self.get_formatted_number(),
-            'masked_number': self.get_masked_number(),
+            'number': self._card_number,
+            'formatted_number': self.formatted_number,
+            'masked_number': self.masked_number,
             'expiry': self.get_expiry(),
-            'expiry_month': self.expiry_month,
-            'expiry_year': self.expiry_year,
-            'cvv': self.cvv,
-            'card_type': self.get_card_type(),
+            'expiry_month': self._expiry_month,
+            'expiry_year': self._expiry_year,
+            'cvv': self._cvv,
+            'card_type': self.card_type,
             'is_valid': self.is_valid()
         }
 
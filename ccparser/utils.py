@@ -5,8 +5,22 @@ This module provides helper functions for detecting card types and
 fetching BIN (Bank Identification Number) information.
 """
 
+import itertools
+import json
+import os
 import re
-from typing import Optional
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:
+    import sqlite3
+
+    import requests
 
 # Card type patterns for detection
 CARD_TYPE_PATTERNS = {
@@ -19,6 +33,86 @@ CARD_TYPE_PATTERNS = {
     "UnionPay": r"^62[0-9]{14,17}$"
 }
 
+_NON_DIGIT_RE = re.compile(r"\D")
+
+# Deletes every Latin-1 character except 0-9, which covers the usual
+# separators much faster than _NON_DIGIT_RE. Latin-1 has no other decimal
+# digits; characters such as '\u00b2' are digits to isdigit() but not to \D.
+_NON_DIGIT_TABLE = str.maketrans("", "", "".join(
+    chr(c) for c in range(256) if not 48 <= c <= 57
+))
+
+_BIN_LOOKUP_URL = 'https://lookup.binlist.net/{}'
+_BIN_LOOKUP_HEADERS = {
+    'User-Agent': 'CCParser/1.0 (https://github.com/VihangaDev/CCParser)',
+    'Accept': 'application/json'
+}
+
+# The optional 'requests' module, imported on first use rather than at
+# import time since it is slow to load and only BIN lookups need it
+_requests: Optional[ModuleType] = None
+
+# Shared HTTP session for BIN lookups, created on first use
+_session: Optional["requests.Session"] = None
+
+# In-memory cache of BIN lookup results, keyed on the BIN alone so that
+# calls with different timeouts share entries; least recently used first
+_BIN_CACHE_SIZE = 4096
+_bin_cache: "OrderedDict[str, Optional[dict]]" = OrderedDict()
+_bin_cache_lock = threading.Lock()
+
+# On-disk BIN lookup cache shared across processes, and how long entries
+# stay fresh. The path is resolved on first use by _bin_db_path().
+_BIN_DB_PATH: Optional[Path] = None
+_BIN_DB_MAX_AGE_DAYS = 30
+# The sqlite3 module, imported on first use since some Python builds lack
+# it; the on-disk cache is disabled if it is missing
+_sqlite3: Optional[ModuleType] = None
+_sqlite3_missing = False
+# The database path this process has already set up, so that set-up runs once
+_bin_db_ready: Optional[Path] = None
+
+# Card type and allowed lengths for each issuer prefix, equivalent to
+# CARD_TYPE_PATTERNS. No prefix extends another, so at most one matches.
+_BIN_PREFIX_TABLE = {
+    "4": ("Visa", (13, 16)),
+    **{prefix: ("MasterCard", (16,)) for prefix in ("51", "52", "53", "54", "55")},
+    "34": ("AMEX", (15,)),
+    "37": ("AMEX", (15,)),
+    **{
+        prefix: ("Discover", (16,))
+        for prefix in ("6011", "644", "645", "646", "647", "648", "649", "65")
+    },
+    "2131": ("JCB", (15,)),
+    "1800": ("JCB", (15,)),
+    "35": ("JCB", (16,)),
+    **{
+        prefix: ("Diners Club", (14,))
+        for prefix in ("300", "301", "302", "303", "304", "305", "36", "38")
+    },
+    "62": ("UnionPay", (16, 17, 18, 19)),
+}
+
+
+def _build_prefix4_table() -> Dict[str, Dict[int, str]]:
+    """
+    Expand _BIN_PREFIX_TABLE to every 4-digit prefix it covers.
+
+    Returns:
+        A dictionary mapping 4-digit prefixes to {card_length: card_type}.
+    """
+    table = {}
+    for prefix, (card_type, lengths) in _BIN_PREFIX_TABLE.items():
+        by_length = dict.fromkeys(lengths, card_type)
+        for suffix in itertools.product("0123456789", repeat=4 - len(prefix)):
+            table[prefix + "".join(suffix)] = by_length
+    return table
+
+
+# Detection needs a single probe on the first 4 digits, then one on the length
+_PREFIX4_TABLE = _build_prefix4_table()
+_NO_MATCH: Dict[int, str] = {}
+
 
 def detect_card_type(card_number: str) -> str:
     """
@@ -45,13 +139,33 @@ def detect_card_type(card_number: str) -> str:
         return "Unknown"
 
     # Clean any non-digit characters
-    clean_number = "".join(c for c in card_number if c.isdigit())
+    if card_number.isdecimal():
+        clean_number = card_number
+    else:
+        clean_number = _strip_non_digits(card_number)
 
-    for card_type, pattern in CARD_TYPE_PATTERNS.items():
-        if re.match(pattern, clean_number):
-            return card_type
+    # The patterns only match ASCII digits 0-9
+    if not clean_number.isascii():
+        return "Unknown"
 
-    return "Unknown"
+    return _PREFIX4_TABLE.get(clean_number[:4], _NO_MATCH).get(len(clean_number), "Unknown")
+
+
+def _strip_non_digits(card_number: str) -> str:
+    """
+    Remove every non-digit character from a card number.
+
+    Args:
+        card_number: The credit card number, possibly with separators.
+
+    Returns:
+        The card number with only its digits.
+    """
+    clean_number = card_number.translate(_NON_DIGIT_TABLE)
+    if not clean_number.isascii():
+        # Characters outside Latin-1 remain; let the regex decide which are digits
+        clean_number = _NON_DIGIT_RE.sub("", card_number)
+    return clean_number
 
 
 def get_card_details(card_number: str, timeout: int = 10) -> Optional[dict]:
@@ -61,9 +175,15 @@ def get_card_details(card_number: str, timeout: int = 10) -> Optional[dict]:
     This function requires the 'requests' library and makes an external
     API call to binlist.net. Install with: pip install ccparser[api]
 
+    Lookups share one HTTP session and results are cached per BIN, both in
+    memory and on disk in ~/.cache/ccparser/bins.db for 30 days, so
+    repeated lookups for the same issuer do not hit the network, even
+    across processes. Use clear_bin_cache() to discard cached results.
+
     Args:
         card_number: The credit card number (at least 6 digits for BIN).
-        timeout: Request timeout in seconds (default: 10).
+        timeout: Timeout in seconds for each HTTP request (default: 10);
+            only server errors are retried.
 
     Returns:
         A dictionary containing card details, or None if lookup fails.
@@ -78,53 +198,20 @@ def get_card_details(card_number: str, timeout: int = 10) -> Optional[dict]:
         >>> details['scheme']
         'visa'
     """
-    try:
-        import requests
-    except ImportError:
-        raise ImportError(
-            "The 'requests' library is required for get_card_details(). "
-            "Install it with: pip install ccparser[api]"
-        )
+    requests = _get_requests()
 
     if not card_number or len(card_number) < 6:
         return None
 
     # Clean the card number and extract BIN
-    clean_number = "".join(c for c in card_number if c.isdigit())
+    if card_number.isdecimal():
+        clean_number = card_number
+    else:
+        clean_number = _strip_non_digits(card_number)
     bin_number = clean_number[:6]
 
-    url = f'https://lookup.binlist.net/{bin_number}'
-    headers = {
-        'User-Agent': 'CCParser/1.0 (https://github.com/VihangaDev/CCParser)',
-        'Accept': 'application/json'
-    }
-
     try:
-        response = requests.get(url, headers=headers, timeout=timeout)
-
-        if response.status_code == 200:
-            data = response.json()
-            card_details = {
-                'bank': data.get('bank', {}).get('name', 'Unknown') if data.get('bank') else 'Unknown',
-                'name': data.get('name', 'Unknown'),
-                'brand': data.get('brand', 'Unknown'),
-                'country': data.get('country', {}).get('name', 'Unknown') if data.get('country') else 'Unknown',
-                'emoji': data.get('country', {}).get('emoji', '') if data.get('country') else '',
-                'scheme': data.get('scheme', 'Unknown'),
-                'type': data.get('type', 'Unknown'),
-                'currency': data.get('country', {}).get('currency', 'Unknown') if data.get('country') else 'Unknown',
-                'bin': 'Credit' if data.get('type') == 'credit' else 'Debit'
-            }
-            return card_details
-        elif response.status_code == 404:
-            # BIN not found in database
-            return None
-        elif response.status_code == 429:
-            # Rate limited
-            return None
-        else:
-            return None
-
+        card_details = _lookup_bin(bin_number, timeout)
     except requests.exceptions.Timeout:
         return None
     except requests.exceptions.ConnectionError:
@@ -134,3 +221,320 @@ def get_card_details(card_number: str, timeout: int = 10) -> Optional[dict]:
     except (ValueError, KeyError):
         # JSON parsing error or missing keys
         return None
+
+    # Copy so callers cannot modify the cached result
+    return dict(card_details) if card_details is not None else None
+
+
+def clear_bin_cache() -> None:
+    """
+    Clear the in-memory and on-disk caches of BIN lookup results.
+
+    Example:
+        >>> clear_bin_cache()
+    """
+    with _bin_cache_lock:
+        _bin_cache.clear()
+    sqlite3 = _get_sqlite3()
+    if sqlite3 is None:
+        return
+    try:
+        conn = _connect_bin_db(create=False)
+        if conn is None:
+            return
+        with closing(conn), conn:
+            conn.execute("DELETE FROM bins")
+    except (sqlite3.Error, OSError):
+        pass
+
+
+def prune_bin_cache(max_age_days: int = _BIN_DB_MAX_AGE_DAYS) -> int:
+    """
+    Remove on-disk BIN lookup results older than max_age_days.
+
+    Args:
+        max_age_days: Age in days beyond which entries are removed (default: 30).
+
+    Returns:
+        The number of entries removed.
+
+    Example:
+        >>> prune_bin_cache(max_age_days=7)
+        0
+    """
+    sqlite3 = _get_sqlite3()
+    if sqlite3 is None:
+        return 0
+    cutoff = int(time.time()) - max_age_days * 86400
+    try:
+        conn = _connect_bin_db(create=False)
+        if conn is None:
+            return 0
+        with closing(conn), conn:
+            return conn.execute("DELETE FROM bins WHERE fetched_at < ?", (cutoff,)).rowcount
+    except (sqlite3.Error, OSError):
+        return 0
+
+
+def _lookup_bin(bin_number: str, timeout: int) -> Optional[dict]:
+    """
+    Look up card details for a BIN, using the on-disk cache when fresh.
+
+    Results, including "BIN not found", are cached per BIN in memory (the
+    4096 most recently used) and on disk. Failures that may succeed later,
+    such as rate limiting, raise instead so that they are not cached.
+
+    Args:
+        bin_number: The 6-digit BIN.
+        timeout: Request timeout in seconds.
+
+    Returns:
+        A dictionary containing card details, or None if the BIN is unknown.
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails or the
+            service returns an error status.
+        ValueError: If the response is not valid JSON.
+    """
+    with _bin_cache_lock:
+        if bin_number in _bin_cache:
+            _bin_cache.move_to_end(bin_number)
+            return _bin_cache[bin_number]
+
+    found, card_details = _read_bin_db(bin_number)
+    if not found:
+        card_details = _fetch_bin(bin_number, timeout)
+        _write_bin_db(bin_number, card_details)
+
+    with _bin_cache_lock:
+        _bin_cache[bin_number] = card_details
+        if len(_bin_cache) > _BIN_CACHE_SIZE:
+            _bin_cache.popitem(last=False)
+    return card_details
+
+
+def _fetch_bin(bin_number: str, timeout: int) -> Optional[dict]:
+    """
+    Fetch card details for a BIN from binlist.net.
+
+    Args:
+        bin_number: The 6-digit BIN.
+        timeout: Request timeout in seconds.
+
+    Returns:
+        A dictionary containing card details, or None if the BIN is unknown.
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails or the
+            service returns an error status.
+        ValueError: If the response is not valid JSON.
+    """
+    response = _get_session().get(_BIN_LOOKUP_URL.format(bin_number), timeout=timeout)
+
+    if response.status_code == 404:
+        # BIN not found in database
+        return None
+
+    # Rate limited (429) or server error
+    response.raise_for_status()
+
+    if response.status_code != 200:
+        return None
+
+    data = response.json()
+    return {
+        'bank': data.get('bank', {}).get('name', 'Unknown') if data.get('bank') else 'Unknown',
+        'name': data.get('name', 'Unknown'),
+        'brand': data.get('brand', 'Unknown'),
+        'country': data.get('country', {}).get('name', 'Unknown') if data.get('country') else 'Unknown',
+        'emoji': data.get('country', {}).get('emoji', '') if data.get('country') else '',
+        'scheme': data.get('scheme', 'Unknown'),
+        'type': data.get('type', 'Unknown'),
+        'currency': data.get('country', {}).get('currency', 'Unknown') if data.get('country') else 'Unknown',
+        'bin': 'Credit' if data.get('type') == 'credit' else 'Debit'
+    }
+
+
+def _bin_db_path() -> Optional[Path]:
+    """
+    Return the on-disk BIN cache path, resolving it on first use.
+
+    The cache lives in $XDG_CACHE_HOME/ccparser/bins.db, or under ~/.cache
+    if XDG_CACHE_HOME is not set to an absolute path.
+
+    Returns:
+        The path, or None if there is no home directory to put it in.
+    """
+    global _BIN_DB_PATH
+    if _BIN_DB_PATH is None:
+        cache_home = os.environ.get("XDG_CACHE_HOME", "")
+        if os.path.isabs(cache_home):
+            base = Path(cache_home)
+        else:
+            try:
+                base = Path.home() / ".cache"
+            except (RuntimeError, KeyError):
+                # No HOME and no passwd entry, e.g. a container running as
+                # an arbitrary user
+                return None
+        _BIN_DB_PATH = base / "ccparser" / "bins.db"
+    return _BIN_DB_PATH
+
+
+def _get_sqlite3() -> Optional[ModuleType]:
+    """Import sqlite3 on first use, returning None if it is unavailable."""
+    global _sqlite3, _sqlite3_missing
+    if _sqlite3 is None and not _sqlite3_missing:
+        try:
+            import sqlite3
+        except ImportError:
+            _sqlite3_missing = True
+        else:
+            _sqlite3 = sqlite3
+    return _sqlite3
+
+
+def _connect_bin_db(create: bool = True) -> Optional["sqlite3.Connection"]:
+    """
+    Open the on-disk BIN cache, creating the file and table if needed.
+
+    The directory, journal mode and table are set up on the first connection
+    to a path only; later connections just open the file.
+
+    Args:
+        create: Whether to create the cache if it does not exist yet.
+
+    Returns:
+        A connection, or None if the on-disk cache is unavailable, or does
+        not exist and create is False.
+    """
+    global _bin_db_ready
+    sqlite = _get_sqlite3()
+    path = _bin_db_path()
+    if sqlite is None or path is None:
+        return None
+    if _bin_db_ready == path:
+        conn: "sqlite3.Connection" = sqlite.connect(path, timeout=5)
+        return conn
+    if not create and not path.exists():
+        return None
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite.connect(path, timeout=5)
+    try:
+        # WAL lets concurrent processes read while another writes, and is
+        # stored in the database file so it only needs setting once
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS bins (bin TEXT PRIMARY KEY, data TEXT, fetched_at INTEGER)"
+        )
+    except sqlite.Error:
+        conn.close()
+        raise
+    _bin_db_ready = path
+    return conn
+
+
+def _reset_bin_db() -> None:
+    """Forget that the BIN cache is set up, e.g. after its file was deleted."""
+    global _bin_db_ready
+    _bin_db_ready = None
+
+
+def _read_bin_db(bin_number: str) -> tuple[bool, Optional[dict]]:
+    """
+    Read a fresh BIN lookup result from the on-disk cache.
+
+    Returns:
+        A (found, card_details) tuple. found is False when there is no
+        fresh entry or the cache cannot be read.
+    """
+    sqlite3 = _get_sqlite3()
+    if sqlite3 is None:
+        return False, None
+    cutoff = int(time.time()) - _BIN_DB_MAX_AGE_DAYS * 86400
+    try:
+        # Leave creating the file to _write_bin_db
+        conn = _connect_bin_db(create=False)
+        if conn is None:
+            return False, None
+        with closing(conn):
+            row = conn.execute(
+                "SELECT data FROM bins WHERE bin = ? AND fetched_at >= ?", (bin_number, cutoff)
+            ).fetchone()
+        if row is None:
+            return False, None
+        return True, json.loads(row[0])
+    except (sqlite3.Error, OSError):
+        _reset_bin_db()
+        return False, None
+    except ValueError:
+        return False, None
+
+
+def _write_bin_db(bin_number: str, card_details: Optional[dict]) -> None:
+    """Store a BIN lookup result in the on-disk cache, ignoring any errors."""
+    sqlite3 = _get_sqlite3()
+    if sqlite3 is None:
+        return
+    try:
+        conn = _connect_bin_db()
+        if conn is None:
+            return
+        with closing(conn), conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO bins (bin, data, fetched_at) VALUES (?, ?, ?)",
+                (bin_number, json.dumps(card_details), int(time.time()))
+            )
+    except (sqlite3.Error, OSError):
+        _reset_bin_db()
+
+
+def _get_requests() -> ModuleType:
+    """
+    Return the 'requests' module, importing it on the first call only.
+
+    Raises:
+        ImportError: If 'requests' library is not installed.
+    """
+    global _requests
+    if _requests is None:
+        try:
+            import requests
+        except ImportError:
+            raise ImportError(
+                "The 'requests' library is required for get_card_details(). "
+                "Install it with: pip install ccparser[api]"
+            )
+        _requests = requests
+    return _requests
+
+
+def _get_session() -> "requests.Session":
+    """
+    Return the shared requests session, creating it on first use.
+
+    The session keeps connections alive between lookups and retries
+    transient server errors (5xx responses). Connection errors and timeouts
+    are not retried, so a lookup that times out gives up after one attempt.
+    """
+    global _session
+    if _session is None:
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry = Retry(
+            total=2,
+            connect=0,
+            read=0,
+            backoff_factor=0.5,
+            status_forcelist=(500, 502, 503, 504),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry)
+
+        session = _get_requests().Session()
+        session.headers.update(_BIN_LOOKUP_HEADERS)
+        session.mount('https://', adapter)
+        _session = session
+    return _session
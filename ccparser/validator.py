@@ -6,19 +6,46 @@ expiry dates, and CVV codes.
 """
 
 import datetime
-from typing import Optional
+import time
+from types import ModuleType
+from typing import Iterable, List, Optional
 from .utils import detect_card_type
 
+# Translation tables that let Luhn sums run entirely in C: ASCII digits to
+# their values, and digit values to their Luhn-doubled values.
+_ASCII_TO_DIGIT = bytes.maketrans(b"0123456789", bytes(range(10)))
+_LUHN_DOUBLED = bytes.maketrans(bytes(range(10)), bytes((0, 2, 4, 6, 8, 1, 3, 5, 7, 9)))
+
+# Card number lengths accepted by validate_card_number
+MIN_CARD_NUMBER_LENGTH = 13
+MAX_CARD_NUMBER_LENGTH = 19
+_VALID_LENGTHS = frozenset(range(MIN_CARD_NUMBER_LENGTH, MAX_CARD_NUMBER_LENGTH + 1))
+
+# CVV length required for each card type, and for any type not listed
+_CVV_LENGTHS = {"AMEX": 4}
+_DEFAULT_CVV_LENGTH = 3
+
+# Today's (year, month) and the time.monotonic() reading it was taken at
+_today_cache = (float("-inf"), (0, 0))
+
+# NumPy, imported on first use by validate_card_numbers since it is optional
+_numpy: Optional[ModuleType] = None
+_numpy_missing = False
+
 
 def validate_card_number(card_number: str) -> bool:
     """
     Validate a credit card number using the Luhn algorithm.
 
+    Numbers that are not 13-19 digits long are rejected without running
+    the checksum.
+
     Args:
         card_number: The credit card number to validate (digits only).
 
     Returns:
-        True if the card number passes Luhn validation, False otherwise.
+        True if the card number passes Luhn validation, False otherwise,
+        including when it is not a string.
 
     Example:
         >>> validate_card_number("4111111111111111")
@@ -26,21 +53,138 @@ def validate_card_number(card_number: str) -> bool:
         >>> validate_card_number("1234567890123456")
         False
     """
-    if not card_number or not card_number.isdigit():
+    if not isinstance(card_number, str) or len(card_number) not in _VALID_LENGTHS:
         return False
+    if not (card_number.isascii() and card_number.isdigit()):
+        return False
+
+    return _luhn_sum(card_number.encode().translate(_ASCII_TO_DIGIT)) % 10 == 0
+
+
+def luhn_check_digit(number: str) -> int:
+    """
+    Calculate the Luhn check digit for a partial card number.
+
+    Args:
+        number: The card number without the check digit (digits 0-9 only).
+
+    Returns:
+        The check digit (0-9) that makes the number pass Luhn validation.
+
+    Example:
+        >>> luhn_check_digit("411111111111111")
+        1
+    """
+    # Append a zero placeholder for the check digit so the doubling
+    # positions line up with the completed number.
+    digits = number.encode().translate(_ASCII_TO_DIGIT) + b"\x00"
+    return (10 - (_luhn_sum(digits) % 10)) % 10
+
+
+def _luhn_sum(digits: bytes) -> int:
+    """
+    Compute the Luhn sum of a sequence of digit values (0-9).
+
+    Every second digit from the right is doubled via a translate table, so
+    slicing, doubling and summing all happen in C with no per-digit loop.
+
+    Args:
+        digits: The digit values, most significant first.
+
+    Returns:
+        The Luhn sum; the digits are valid when it is divisible by 10.
+    """
+    return sum(digits[-1::-2]) + sum(digits[-2::-2].translate(_LUHN_DOUBLED))
+
+
+def validate_card_numbers(card_numbers: Iterable[str]) -> List[bool]:
+    """
+    Validate many credit card numbers using the Luhn algorithm.
+
+    Gives the same result for each number as validate_card_number(). When
+    NumPy is installed (pip install ccparser[fast]), numbers of the same
+    length are checked together as one array, which is several times
+    faster for large batches.
+
+    Args:
+        card_numbers: The credit card numbers to validate (digits only).
+
+    Returns:
+        A list with True for each number that passes Luhn validation and
+        False otherwise, in input order.
+
+    Example:
+        >>> validate_card_numbers(["4111111111111111", "4111111111111112"])
+        [True, False]
+    """
+    card_numbers = list(card_numbers)
+    np = _get_numpy()
+    if np is None:
+        return [validate_card_number(card_number) for card_number in card_numbers]
+
+    # Common case: numbers of one length, checked as a single array
+    try:
+        lengths = set(map(len, card_numbers))
+        if len(lengths) == 1:
+            length = lengths.pop()
+            if length in _VALID_LENGTHS:
+                joined = "".join(card_numbers)
+                if joined.isascii():
+                    return _luhn_valid_array(np, joined, length)
+    except TypeError:
+        pass
+
+    # Group positions by length so each group forms a rectangular array
+    groups: dict = {}
+    for index, card_number in enumerate(card_numbers):
+        if isinstance(card_number, str) and len(card_number) in _VALID_LENGTHS:
+            groups.setdefault(len(card_number), []).append(index)
+
+    results = [False] * len(card_numbers)
+    for length, indices in groups.items():
+        joined = "".join([card_numbers[index] for index in indices])
+        if not joined.isascii():
+            for index in indices:
+                results[index] = validate_card_number(card_numbers[index])
+            continue
 
-    def luhn_checksum(number: str) -> int:
-        def digits_of(n: str) -> list[int]:
-            return [int(d) for d in str(n)]
-        digits = digits_of(number)
-        odd_digits = digits[-1::-2]
-        even_digits = digits[-2::-2]
-        checksum = sum(odd_digits)
-        for d in even_digits:
-            checksum += sum(digits_of(d * 2))
-        return checksum % 10
+        for index, is_valid in zip(indices, _luhn_valid_array(np, joined, length)):
+            results[index] = is_valid
+    return results
 
-    return luhn_checksum(card_number) == 0
+
+def _luhn_valid_array(np: ModuleType, joined: str, length: int) -> List[bool]:
+    """
+    Luhn-check card numbers of one length concatenated into an ASCII string.
+
+    Returns:
+        A list of booleans, True where the number is all digits and passes
+        Luhn validation.
+    """
+    # Non-digits wrap around to values above 9 after subtracting '0'
+    digits = np.frombuffer(joined.encode(), dtype=np.uint8).reshape(-1, length) - 48
+    valid = (digits <= 9).all(axis=1)
+
+    # Double every second digit from the right in place, folding results above 9
+    doubled = digits[:, length - 2::-2]
+    doubled *= 2
+    doubled -= 9 * (doubled > 9).view(np.uint8)
+    valid &= digits.sum(axis=1, dtype=np.int64) % 10 == 0
+    results: List[bool] = valid.tolist()
+    return results
+
+
+def _get_numpy() -> Optional[ModuleType]:
+    """Import NumPy on first use, returning None if it is not installed."""
+    global _numpy, _numpy_missing
+    if _numpy is None and not _numpy_missing:
+        try:
+            import numpy
+        except ImportError:
+            _numpy_missing = True
+        else:
+            _numpy = numpy
+    return _numpy
 
 
 def validate_expiry_date(month: str, year: str) -> bool:
@@ -75,33 +219,35 @@ def validate_expiry_date(month: str, year: str) -> bool:
             return False
 
         # Validate year is reasonable (not too far in past or future)
-        current_year = datetime.datetime.now().year
+        current_year, current_month = _current_year_month()
         if year_int < current_year - 10 or year_int > current_year + 20:
             return False
 
-        # Create expiry date (first day of expiry month)
-        expiry_date = datetime.datetime(year_int, month_int, 1)
+        # The card is valid through the last day of its expiry month, so
+        # only the year and month need comparing
+        return (year_int, month_int) >= (current_year, current_month)
 
-        # Calculate the last day of the expiry month
-        if month_int == 12:
-            # December: last day is the 31st
-            last_day = 31
-        else:
-            # Get the first day of next month and subtract one day
-            next_month = datetime.datetime(year_int, month_int + 1, 1)
-            last_day = (next_month - datetime.timedelta(days=1)).day
+    except (ValueError, TypeError):
+        return False
 
-        expiry_date = expiry_date.replace(day=last_day)
 
-        # Compare with current date (ignoring time, just date)
-        now = datetime.datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        return expiry_date >= now
+def _current_year_month() -> tuple[int, int]:
+    """
+    Return today's (year, month), reading the clock at most once a second.
 
-    except (ValueError, TypeError):
-        return False
+    Validating many cards in a loop then shares one date lookup.
+    """
+    global _today_cache
+    checked_at, year_month = _today_cache
+    now = time.monotonic()
+    if now - checked_at > 1.0:
+        today = datetime.date.today()
+        year_month = (today.year, today.month)
+        _today_cache = (now, year_month)
+    return year_month
 
 
-def validate_cvv(cvv: str, card_number: str) -> bool:
+def validate_cvv(cvv: str, card_number: str, card_type: Optional[str] = None) -> bool:
     """
     Validate a CVV (Card Verification Value) code.
 
@@ -110,6 +256,8 @@ def validate_cvv(cvv: str, card_number: str) -> bool:
     Args:
         cvv: The CVV code to validate.
         card_number: The associated card number (used to determine card type).
+        card_type: The already-detected card type, if known. Skips detecting
+            it again from card_number.
 
     Returns:
         True if the CVV is valid for the card type, False otherwise.
@@ -122,10 +270,60 @@ def validate_cvv(cvv: str, card_number: str) -> bool:
         >>> validate_cvv("123", "378282246310005")  # AMEX with 3-digit CVV
         False
     """
-    if not cvv or not cvv.isdigit():
+    if not cvv or not (cvv.isascii() and cvv.isdigit()):
         return False
 
-    card_type = detect_card_type(card_number)
-    if card_type == "AMEX":
-        return len(cvv) == 4
-    return len(cvv) == 3
+    # No card type accepts other lengths, so skip detecting it
+    cvv_length = len(cvv)
+    if cvv_length != 3 and cvv_length != 4:
+        return False
+
+    if card_type is None:
+        card_type = detect_card_type(card_number)
+    return cvv_length == expected_cvv_length(card_type)
+
+
+def expected_cvv_length(card_type: str) -> int:
+    """
+    Get the CVV length required for a card type.
+
+    Args:
+        card_type: The card type name (e.g., 'Visa', 'AMEX').
+
+    Returns:
+        4 for AMEX cards, 3 for all other card types.
+
+    Example:
+        >>> expected_cvv_length("AMEX")
+        4
+    """
+    return _CVV_LENGTHS.get(card_type, _DEFAULT_CVV_LENGTH)
+
+
+def validate_card(card_number: str, month: str, year: str, cvv: str,
+                  card_type: Optional[str] = None) -> bool:
+    """
+    Validate a card's number, expiry date and CVV together.
+
+    Equivalent to running validate_card_number(), validate_expiry_date()
+    and validate_cvv() in turn, stopping at the first failure.
+
+    Args:
+        card_number: The credit card number (digits only).
+        month: The expiry month (1-12 or 01-12).
+        year: The expiry year (YYYY or YY format).
+        cvv: The CVV code.
+        card_type: The already-detected card type, if known.
+
+    Returns:
+        True if all three validations pass, False otherwise.
+
+    Example:
+        >>> validate_card("4111111111111111", "12", "2030", "123")
+        True
+    """
+    return (
+        validate_card_number(card_number)
+        and validate_expiry_date(month, year)
+        and validate_cvv(cvv, card_number, card_type)
+    )
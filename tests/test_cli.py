@@ -1,121 +1,246 @@
 """Tests for the CLI module."""
 
 import json
+import os
 import subprocess
 import sys
 
+import pytest
+
+from ccparser.cli import main
+
+
+def _run_cli(argv, capsys):
+    """Run the CLI in-process, returning (exit code, stdout, stderr)."""
+    try:
+        returncode = main(argv)
+    except SystemExit as e:
+        returncode = e.code or 0
+    captured = capsys.readouterr()
+    return returncode, captured.out, captured.err
+
 
 class TestCLI:
     """Tests for the ccparser CLI."""
 
-    def test_basic_parsing(self):
-        """Test basic card parsing output."""
+    def test_module_entry_point(self):
+        """Test that python -m ccparser.cli runs the CLI."""
         result = subprocess.run(
             [sys.executable, "-m", "ccparser.cli", "4111111111111111|12|2030|123"],
             capture_output=True,
             text=True
         )
+        assert result.returncode == 0
         assert "Card Number: 4111 1111 1111 1111" in result.stdout
-        assert "Expiry Date: 12/30" in result.stdout
-        assert "CVV: 123" in result.stdout
-        assert "Card Type: Visa" in result.stdout
-        assert "Valid: True" in result.stdout
 
-    def test_masked_output(self):
+    def test_basic_parsing(self, capsys):
+        """Test basic card parsing output."""
+        _, stdout, _ = _run_cli(["4111111111111111|12|2030|123"], capsys)
+        assert "Card Number: 4111 1111 1111 1111" in stdout
+        assert "Expiry Date: 12/30" in stdout
+        assert "CVV: 123" in stdout
+        assert "Card Type: Visa" in stdout
+        assert "Valid: True" in stdout
+
+    def test_masked_output(self, capsys):
         """Test masked card number output."""
-        result = subprocess.run(
-            [sys.executable, "-m", "ccparser.cli", "--masked", "4111111111111111|12|2030|123"],
-            capture_output=True,
-            text=True
-        )
-        assert "**** **** **** 1111" in result.stdout
-        assert "4111 1111 1111 1111" not in result.stdout
+        _, stdout, _ = _run_cli(["--masked", "4111111111111111|12|2030|123"], capsys)
+        assert "**** **** **** 1111" in stdout
+        assert "4111 1111 1111 1111" not in stdout
 
-    def test_json_output(self):
+    def test_json_output(self, capsys):
         """Test JSON format output."""
-        result = subprocess.run(
-            [sys.executable, "-m", "ccparser.cli", "--json", "4111111111111111|12|2030|123"],
-            capture_output=True,
-            text=True
-        )
-        output = json.loads(result.stdout)
+        _, stdout, _ = _run_cli(["--json", "4111111111111111|12|2030|123"], capsys)
+        output = json.loads(stdout)
         assert output['number'] == "4111111111111111"
         assert output['card_type'] == "Visa"
         assert output['is_valid'] is True
 
-    def test_quiet_mode_valid(self):
+    def test_json_error_output(self, capsys):
+        """Test JSON format output for an invalid card string."""
+        returncode, stdout, _ = _run_cli(["--json", "invalid"], capsys)
+        assert returncode == 1
+        output = json.loads(stdout)
+        assert "Invalid card string format" in output['error']
+
+    def test_dumps_matches_stdlib_json(self):
+        """Test that _dumps output matches json.dumps with indent=2."""
+        from ccparser import CCParser
+        from ccparser.cli import _dumps
+        for output in [
+            CCParser("4111111111111111|12|2030|123").to_dict(),
+            {"error": "Invalid month: \u00e9. Must be numeric"},
+        ]:
+            assert _dumps(output) == json.dumps(output, indent=2, ensure_ascii=False)
+
+    def test_compact_dumps_matches_stdlib_json(self):
+        """Test that compact _dumps output matches json.dumps without whitespace."""
+        from ccparser import CCParser
+        from ccparser.cli import _dumps
+        for output in [
+            CCParser("4111111111111111|12|2030|123").to_dict(),
+            {"error": "Invalid month: \u00e9. Must be numeric"},
+        ]:
+            expected = json.dumps(output, separators=(",", ":"), ensure_ascii=False)
+            assert _dumps(output, indent=False) == expected
+
+    def test_quiet_mode_valid(self, capsys):
         """Test quiet mode with valid card returns 0."""
-        result = subprocess.run(
-            [sys.executable, "-m", "ccparser.cli", "--quiet", "4111111111111111|12|2030|123"],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode == 0
-        assert result.stdout == ""
+        returncode, stdout, _ = _run_cli(["--quiet", "4111111111111111|12|2030|123"], capsys)
+        assert returncode == 0
+        assert stdout == ""
 
-    def test_quiet_mode_invalid(self):
+    def test_quiet_mode_invalid(self, capsys):
         """Test quiet mode with invalid card returns 1."""
-        result = subprocess.run(
-            [sys.executable, "-m", "ccparser.cli", "--quiet", "4111111111111112|12|2030|123"],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode == 1
+        returncode, _, _ = _run_cli(["--quiet", "4111111111111112|12|2030|123"], capsys)
+        assert returncode == 1
 
-    def test_invalid_card_error(self):
+    def test_invalid_card_error(self, capsys):
         """Test error message for invalid card format."""
-        result = subprocess.run(
-            [sys.executable, "-m", "ccparser.cli", "invalid"],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode == 1
-        assert "Error" in result.stderr
+        returncode, _, stderr = _run_cli(["invalid"], capsys)
+        assert returncode == 1
+        assert "Error" in stderr
 
-    def test_version_flag(self):
+    def test_version_flag(self, capsys):
         """Test --version flag."""
-        result = subprocess.run(
-            [sys.executable, "-m", "ccparser.cli", "--version"],
-            capture_output=True,
-            text=True
-        )
-        assert "ccparser" in result.stdout.lower()
+        _, stdout, _ = _run_cli(["--version"], capsys)
+        assert "ccparser" in stdout.lower()
 
-    def test_help_flag(self):
+    def test_help_flag(self, capsys):
         """Test --help flag."""
-        result = subprocess.run(
-            [sys.executable, "-m", "ccparser.cli", "--help"],
-            capture_output=True,
-            text=True
-        )
-        assert "usage" in result.stdout.lower()
-        assert "--masked" in result.stdout
-        assert "--json" in result.stdout
+        _, stdout, _ = _run_cli(["--help"], capsys)
+        assert "usage" in stdout.lower()
+        assert "--masked" in stdout
+        assert "--json" in stdout
 
-    def test_exit_code_valid_card(self):
+    def test_exit_code_valid_card(self, capsys):
         """Test exit code is 0 for valid card."""
-        result = subprocess.run(
-            [sys.executable, "-m", "ccparser.cli", "4111111111111111|12|2030|123"],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode == 0
+        returncode, _, _ = _run_cli(["4111111111111111|12|2030|123"], capsys)
+        assert returncode == 0
 
-    def test_exit_code_invalid_luhn(self):
+    def test_exit_code_invalid_luhn(self, capsys):
         """Test exit code is 1 for invalid Luhn."""
-        result = subprocess.run(
-            [sys.executable, "-m", "ccparser.cli", "4111111111111112|12|2030|123"],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode == 1
+        returncode, _, _ = _run_cli(["4111111111111112|12|2030|123"], capsys)
+        assert returncode == 1
 
-    def test_amex_card(self):
+    def test_amex_card(self, capsys):
         """Test AMEX card parsing."""
-        result = subprocess.run(
-            [sys.executable, "-m", "ccparser.cli", "378282246310005|12|2030|1234"],
-            capture_output=True,
-            text=True
-        )
-        assert "Card Type: AMEX" in result.stdout
-        assert "3782 822463 10005" in result.stdout
+        _, stdout, _ = _run_cli(["378282246310005|12|2030|1234"], capsys)
+        assert "Card Type: AMEX" in stdout
+        assert "3782 822463 10005" in stdout
+
+
+class TestBatch:
+    """Tests for the --batch option."""
+
+    CARD_STRINGS = [
+        "4111111111111111|12|2030|123",
+        "",
+        "378282246310005|12|2030|1234",
+        "invalid",
+        "4111111111111112|12|2030|123",
+    ]
+
+    @pytest.fixture
+    def batch_file(self, tmp_path):
+        path = tmp_path / "cards.txt"
+        path.write_text("\n".join(self.CARD_STRINGS) + "\n")
+        return str(path)
+
+    def test_one_line_per_card(self, batch_file, capsys):
+        """Test that each non-blank line gives one output line."""
+        returncode, stdout, _ = _run_cli(["--batch", batch_file, "--jobs", "1"], capsys)
+        assert returncode == 1
+        assert stdout.splitlines() == [
+            "4111 1111 1111 1111\t12/30\tVisa\tTrue",
+            "3782 822463 10005\t12/30\tAMEX\tTrue",
+            "Error: Invalid card string format. Expected: NUMBER|MM|YYYY|CVV or NUMBER|MM/YY|CVV",
+            "4111 1111 1111 1112\t12/30\tVisa\tFalse",
+        ]
+
+    @pytest.mark.skipif(not os.path.isdir("/dev/fd"), reason="needs /dev/fd")
+    @pytest.mark.parametrize("quiet", [False, True])
+    def test_pipe(self, capsys, quiet):
+        """Test that card strings read from a pipe are processed, not skipped as empty."""
+        read_fd, write_fd = os.pipe()
+        try:
+            os.write(write_fd, ("\n".join(self.CARD_STRINGS) + "\n").encode())
+            os.close(write_fd)
+            argv = ["--batch", f"/dev/fd/{read_fd}"] + (["--quiet"] if quiet else [])
+            returncode, stdout, _ = _run_cli(argv, capsys)
+        finally:
+            os.close(read_fd)
+        assert returncode == 1
+        assert len(stdout.splitlines()) == (0 if quiet else 4)
+
+    def test_json_lines(self, batch_file, capsys):
+        """Test that JSON output gives one object per line."""
+        _, stdout, _ = _run_cli(["--batch", batch_file, "--json", "--masked", "--jobs", "1"], capsys)
+        outputs = [json.loads(line) for line in stdout.splitlines()]
+        assert outputs[0]['number'] == "**** **** **** 1111"
+        assert outputs[1]['card_type'] == "AMEX"
+        assert "error" in outputs[2]
+        assert outputs[3]['is_valid'] is False
+
+    def test_all_valid_exit_code(self, tmp_path, capsys):
+        """Test that the exit code is 0 when every card is valid."""
+        path = tmp_path / "cards.txt"
+        path.write_text("4111111111111111|12|2030|123\n378282246310005|12|2030|1234\n")
+        returncode, stdout, _ = _run_cli(["--batch", str(path), "--quiet"], capsys)
+        assert returncode == 0
+        assert stdout == ""
+
+    def test_quiet_invalid_exit_code(self, batch_file, capsys):
+        """Test that quiet mode prints nothing and fails if any card is invalid."""
+        returncode, stdout, _ = _run_cli(["--batch", batch_file, "--quiet"], capsys)
+        assert returncode == 1
+        assert stdout == ""
+
+    def test_parallel_matches_serial(self, batch_file, capsys, monkeypatch):
+        """Test that splitting across worker processes keeps the output order."""
+        from ccparser import cli
+        _, serial, _ = _run_cli(["--batch", batch_file, "--jobs", "1"], capsys)
+        monkeypatch.setattr(cli, "_MIN_CHUNK_BYTES", 1)
+        _, parallel, _ = _run_cli(["--batch", batch_file, "--jobs", "3"], capsys)
+        assert parallel == serial
+
+    def test_missing_file(self, tmp_path, capsys):
+        """Test error for a batch file that does not exist."""
+        returncode, _, stderr = _run_cli(["--batch", str(tmp_path / "missing.txt")], capsys)
+        assert returncode == 1
+        assert "Error" in stderr
+
+    def test_card_string_with_batch(self, batch_file, capsys):
+        """Test that a card string cannot be combined with --batch."""
+        returncode, _, _ = _run_cli(["--batch", batch_file, "4111111111111111|12|2030|123"], capsys)
+        assert returncode == 2
+
+    def test_missing_card_string(self, capsys):
+        """Test that a card string is required without --batch."""
+        returncode, _, stderr = _run_cli([], capsys)
+        assert returncode == 2
+        assert "card_string" in stderr
+
+
+class TestChunkBounds:
+    """Tests for _chunk_bounds helper."""
+
+    def test_ranges_end_on_line_boundaries(self, tmp_path):
+        """Test that ranges cover the file and split only after newlines."""
+        from ccparser.cli import _chunk_bounds
+        path = tmp_path / "cards.txt"
+        data = b"".join(b"4111111111111111|12|2030|%d\n" % i for i in range(100, 200))
+        path.write_bytes(data)
+        bounds = _chunk_bounds(str(path), 4)
+        assert len(bounds) == 4
+        assert bounds[0][0] == 0 and bounds[-1][1] == len(data)
+        for (_, end), (start, _) in zip(bounds, bounds[1:]):
+            assert end == start
+            assert data[end - 1:end] == b"\n"
+
+    def test_more_parts_than_lines(self, tmp_path):
+        """Test that a short file gives at most one range per line."""
+        from ccparser.cli import _chunk_bounds
+        path = tmp_path / "cards.txt"
+        path.write_bytes(b"a\nb\n")
+        assert _chunk_bounds(str(path), 8) == [(0, 2), (2, 4)]
@@ -47,6 +47,11 @@ class TestFormatCardNumber:
         result = format_card_number("4111-1111-1111-1111")
         assert result == "4111 1111 1111 1111"
 
+    def test_format_strips_superscript_digits(self):
+        """Test that digit-like characters that are not decimal digits are stripped."""
+        result = format_card_number("4111\u00b2111111111111")
+        assert result == "4111 1111 1111 1111"
+
 
 class TestMaskCardNumber:
     """Tests for mask_card_number function."""
@@ -91,3 +96,13 @@ class TestMaskCardNumber:
         # Test with a 12-digit number to use generic fallback
         result = mask_card_number("411111111111", visible_digits=4)
         assert result == "**** **** 1111"
+
+    def test_mask_19_digit(self):
+        """Test masking a 19-digit card number."""
+        result = mask_card_number("6212345678901234569")
+        assert result == "**** **** **** ***4 569"
+
+    def test_mask_16_digit_custom_visible_digits(self):
+        """Test that 16-digit numbers keep their layout with other visible counts."""
+        result = mask_card_number("4111111111111111", visible_digits=2)
+        assert result == "**** **** **** 11"
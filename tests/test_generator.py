@@ -1,7 +1,12 @@
 """Tests for the generator module."""
 
 import pytest
-from ccparser.generator import generate_card_number, get_supported_card_types
+from ccparser.generator import (
+    generate_card_number,
+    generate_card_numbers,
+    get_supported_card_types,
+    _calculate_luhn_check_digit,
+)
 from ccparser.validator import validate_card_number
 from ccparser.utils import detect_card_type
 
@@ -89,6 +94,46 @@ class TestGenerateCardNumber:
         assert len(set(cards)) == len(cards)
 
 
+class TestGenerateCardNumbers:
+    """Tests for generate_card_numbers function."""
+
+    def test_generates_requested_count(self):
+        """Test that the requested number of valid cards is returned."""
+        card_numbers = generate_card_numbers("AMEX", 5)
+        assert len(card_numbers) == 5
+        for card_number in card_numbers:
+            assert validate_card_number(card_number) is True
+            assert detect_card_type(card_number) == "AMEX"
+
+    def test_zero_count(self):
+        """Test that a count of zero returns an empty list."""
+        assert generate_card_numbers("Visa", 0) == []
+
+    def test_negative_count_raises(self):
+        """Test that a negative count raises ValueError."""
+        with pytest.raises(ValueError):
+            generate_card_numbers("Visa", -1)
+
+    def test_unsupported_card_type_raises(self):
+        """Test that unsupported card type raises ValueError."""
+        with pytest.raises(ValueError):
+            generate_card_numbers("InvalidType", 3)
+
+    def test_reproducible_with_seed(self):
+        """Test that same seed produces same card numbers."""
+        assert generate_card_numbers("Visa", 3, seed=42) == generate_card_numbers("Visa", 3, seed=42)
+
+
+class TestCalculateLuhnCheckDigit:
+    """Tests for _calculate_luhn_check_digit function."""
+
+    def test_known_check_digits(self):
+        """Test check digits of well-known test card numbers."""
+        assert _calculate_luhn_check_digit("411111111111111") == 1
+        assert _calculate_luhn_check_digit("37828224631000") == 5
+        assert _calculate_luhn_check_digit("3056930902590") == 4
+
+
 class TestGetSupportedCardTypes:
     """Tests for get_supported_card_types function."""
 
@@ -10,6 +10,12 @@ from ccparser import (
 )
 
 
+@pytest.fixture(scope="module")
+def visa_card():
+    """A valid Visa card shared by tests that only read from it."""
+    return CCParser("4111111111111111|12|2030|123")
+
+
 class TestCCParserBasic:
     """Basic parsing tests."""
 
@@ -35,6 +41,35 @@ class TestCCParserBasic:
         card = CCParser("4111111111111111:12:2030:123")
         assert card.get_number() == "4111111111111111"
 
+    def test_parse_mixed_repeated_delimiters(self):
+        """Test parsing with mixed and repeated delimiters."""
+        card = CCParser("4111111111111111||12:2030  123")
+        assert card.get_number() == "4111111111111111"
+        assert card.get_expiry_full() == "12/2030"
+        assert card.get_cvv() == "123"
+
+    def test_pipe_fast_path_matches_general_parser(self):
+        """Test that the pipe-delimited fast path parses like the general parser."""
+        from ccparser.parser import _parse_pipe_delimited
+        card_strings = [
+            "4111111111111111|12|2030|123",
+            "4111111111111111|1|30|123",
+            "378282246310005|07|2031|1234",
+            "4111111111111111|012|2030|123",
+        ]
+        for card_string in card_strings:
+            card = CCParser(card_string.replace("|", ":"))
+            expected = (card.card_number, card.expiry_month, card.expiry_year, card.cvv)
+            assert _parse_pipe_delimited(card_string) == expected
+
+    def test_pipe_fast_path_falls_back(self):
+        """Test that unusual pipe-delimited strings fall back to the general parser."""
+        from ccparser.parser import _parse_pipe_delimited
+        assert _parse_pipe_delimited("4111111111111111||12|2030|123") is None
+        assert _parse_pipe_delimited("4111111111111111|13|2030|123") is None
+        assert _parse_pipe_delimited("4111111111111111|12|203|123") is None
+        assert CCParser("4111111111111111||12|2030|123").get_expiry() == "12/30"
+
     def test_parse_slash_expiry(self):
         """Test parsing with MM/YY expiry format."""
         card = CCParser("4111111111111111|12/30|123")
@@ -51,10 +86,9 @@ class TestCCParserBasic:
         card = CCParser("4111111111111111|12|30|123")
         assert card.get_year() == "2030"
 
-    def test_parse_four_digit_year(self):
+    def test_parse_four_digit_year(self, visa_card):
         """Test parsing with 4-digit year."""
-        card = CCParser("4111111111111111|12|2030|123")
-        assert card.get_year() == "2030"
+        assert visa_card.get_year() == "2030"
 
 
 class TestCCParserCardTypes:
@@ -90,10 +124,9 @@ class TestCCParserCardTypes:
 class TestCCParserValidation:
     """Tests for validation functionality."""
 
-    def test_is_valid_returns_bool(self):
+    def test_is_valid_returns_bool(self, visa_card):
         """Test that is_valid returns boolean, not raises."""
-        card = CCParser("4111111111111111|12|2030|123")
-        result = card.is_valid()
+        result = visa_card.is_valid()
         assert isinstance(result, bool)
         assert result is True
 
@@ -112,12 +145,57 @@ class TestCCParserValidation:
         card = CCParser("4111111111111111|12|2030|12")  # Too short
         assert card.is_valid() is False
 
+    def test_is_valid_matches_validate(self):
+        """Test that is_valid agrees with validate() across failure kinds."""
+        card_strings = [
+            "4111111111111111|12|2030|123",
+            "378282246310005|12|2030|1234",
+            "378282246310005|12|2030|123",
+            "4111111111111112|12|2030|123",
+            "4111111111111111|01|2020|123",
+            "4111111111111111|12|2099|123",
+            "4111111111111111|12|20AB|123",
+            "424242424242|12|2030|123",
+            "4111111111111111|12|0030|123",
+            "4111111111111111:12:+030:123",
+        ]
+        for card_string in card_strings:
+            card = CCParser(card_string)
+            try:
+                card.validate()
+                expected = True
+            except CCParserError:
+                expected = False
+            assert card.is_valid() is expected
+
+    def test_is_valid_only_matches_is_valid(self):
+        """Test that is_valid_only agrees with is_valid and rejects bad strings."""
+        card_strings = [
+            "4111111111111111|12|2030|123",
+            "378282246310005|12/30|1234",
+            "378282246310005|12|2030|123",
+            "4111111111111112|12|2030|123",
+            "4111111111111111|01|2020|123",
+            "  4111111111111111:12:2030:123  ",
+            "4111111111111111|12|0030|123",
+        ]
+        for card_string in card_strings:
+            assert CCParser.is_valid_only(card_string) is CCParser(card_string).is_valid()
+        for card_string in ["", None, "invalid", "4111111111111111|13|2030|123"]:
+            assert CCParser.is_valid_only(card_string) is False
+
     def test_validate_raises_on_invalid_luhn(self):
         """Test that validate() raises for invalid Luhn."""
         card = CCParser("4111111111111112|12|2030|123")
         with pytest.raises(InvalidCardNumberError):
             card.validate()
 
+    def test_validate_names_invalid_length(self):
+        """Test that validate() reports a bad length rather than a Luhn failure."""
+        card = CCParser("411111111117|12|2030|123")
+        with pytest.raises(InvalidCardNumberError, match="length: 12 digits"):
+            card.validate()
+
     def test_validate_raises_on_expired(self):
         """Test that validate() raises for expired card."""
         card = CCParser("4111111111111111|01|2020|123")
@@ -130,6 +208,13 @@ class TestCCParserValidation:
         with pytest.raises(InvalidCVVError):
             card.validate()
 
+    def test_validate_cvv_error_expected_length(self):
+        """Test that the CVV error states the length for the card type."""
+        with pytest.raises(InvalidCVVError, match="Expected 4 digits"):
+            CCParser("378282246310005|12|2030|123").validate()
+        with pytest.raises(InvalidCVVError, match="Expected 3 digits"):
+            CCParser("4111111111111111|12|2030|1234").validate()
+
 
 class TestCCParserErrors:
     """Tests for error handling."""
@@ -149,6 +234,13 @@ class TestCCParserErrors:
         with pytest.raises(InvalidCardNumberError):
             CCParser("4111111111111111")
 
+    def test_invalid_expiry_separator_raises(self):
+        """Test that a 3-part string without an expiry separator raises error."""
+        with pytest.raises(InvalidExpiryDateError):
+            CCParser("4111111111111111|1230|123")
+        with pytest.raises(InvalidExpiryDateError):
+            CCParser("4111111111111111|12/30-1|123")
+
     def test_invalid_month_raises(self):
         """Test that invalid month raises error."""
         with pytest.raises(InvalidExpiryDateError):
@@ -159,11 +251,25 @@ class TestCCParserErrors:
         with pytest.raises(InvalidExpiryDateError):
             CCParser("4111111111111111|00|2030|123")
 
+    def test_overlong_month_raises(self):
+        """Test that a month too long for int() raises error rather than ValueError."""
+        card_string = "4111111111111111|" + "0" * 4999 + "1|2030|123"
+        with pytest.raises(InvalidExpiryDateError):
+            CCParser(card_string)
+        assert CCParser.is_valid_only(card_string) is False
+
     def test_non_numeric_card_raises(self):
         """Test that non-numeric card number raises error."""
         with pytest.raises(InvalidCardNumberError):
             CCParser("4111ABCD11111111|12|2030|123")
 
+    def test_non_ascii_digits_raise(self):
+        """Test that digits outside 0-9 are rejected in the card number and CVV."""
+        with pytest.raises(InvalidCardNumberError):
+            CCParser("\u0664111111111111111|12|2030|123")
+        with pytest.raises(InvalidCVVError):
+            CCParser("4111111111111111|12|2030|\u0661\u0662\u0663")
+
     def test_non_numeric_cvv_raises(self):
         """Test that non-numeric CVV raises error."""
         with pytest.raises(InvalidCVVError):
@@ -179,15 +285,13 @@ class TestCCParserErrors:
 class TestCCParserMethods:
     """Tests for additional CCParser methods."""
 
-    def test_get_expiry_full(self):
+    def test_get_expiry_full(self, visa_card):
         """Test get_expiry_full method."""
-        card = CCParser("4111111111111111|12|2030|123")
-        assert card.get_expiry_full() == "12/2030"
+        assert visa_card.get_expiry_full() == "12/2030"
 
-    def test_to_dict(self):
+    def test_to_dict(self, visa_card):
         """Test to_dict method."""
-        card = CCParser("4111111111111111|12|2030|123")
-        result = card.to_dict()
+        result = visa_card.to_dict()
         assert result['number'] == "4111111111111111"
         assert result['formatted_number'] == "4111 1111 1111 1111"
         assert result['masked_number'] == "**** **** **** 1111"
@@ -198,17 +302,69 @@ class TestCCParserMethods:
         assert result['card_type'] == "Visa"
         assert result['is_valid'] is True
 
-    def test_repr(self):
-        """Test __repr__ method."""
+    def test_results_are_cached(self):
+        """Test that derived values are computed once and reused."""
         card = CCParser("4111111111111111|12|2030|123")
-        repr_str = repr(card)
+        assert card.get_formatted_number() is card.get_formatted_number()
+        assert card.get_masked_number() is card.get_masked_number()
+        assert card.is_valid() is True
+        assert card._is_valid is True
+
+    def test_properties(self):
+        """Test the card_type, formatted_number and masked_number properties."""
+        card = CCParser("378282246310005|12|2030|1234")
+        assert card.card_type == card.get_card_type() == "AMEX"
+        assert card.formatted_number == card.get_formatted_number() == "3782 822463 10005"
+        assert card.masked_number == card.get_masked_number() == "**** ****** *0005"
+        assert card.masked_number is card.masked_number
+
+    def test_properties_are_read_only(self):
+        """Test that the derived properties cannot be assigned."""
+        card = CCParser("4111111111111111|12|2030|123")
+        with pytest.raises(AttributeError):
+            card.card_type = "MasterCard"
+
+    def test_assigning_fields_updates_cached_values(self):
+        """Test that assigning a parsed field clears the values derived from it."""
+        card = CCParser("4111111111111111|12|2030|123")
+        assert card.is_valid() is True
+        assert card.masked_number == "**** **** **** 1111"
+
+        card.card_number = "378282246310005"
+        assert card.card_type == "AMEX"
+        assert card.formatted_number == "3782 822463 10005"
+        assert card.masked_number == "**** ****** *0005"
+        assert card.is_valid() is False
+
+        card.cvv = "1234"
+        assert card.is_valid() is True
+        card.expiry_year = "2020"
+        assert card.is_valid() is False
+        card.expiry_year = "2030"
+        card.expiry_month = "13"
+        assert card.is_valid() is False
+
+    def test_no_instance_dict(self, visa_card):
+        """Test that instances use slots instead of a __dict__."""
+        assert not hasattr(visa_card, "__dict__")
+
+    def test_pickle_round_trip(self):
+        """Test that instances survive pickling."""
+        import pickle
+        card = CCParser("378282246310005|12|2030|1234")
+        card.is_valid()
+        restored = pickle.loads(pickle.dumps(card))
+        assert restored.to_dict() == card.to_dict()
+
+    def test_repr(self, visa_card):
+        """Test __repr__ method."""
+        repr_str = repr(visa_card)
         assert "CCParser" in repr_str
         assert "Visa" in repr_str
 
-    def test_str(self):
+    def test_str(self, visa_card):
         """Test __str__ method."""
-        card = CCParser("4111111111111111|12|2030|123")
-        str_str = str(card)
+        str_str = str(visa_card)
         assert "Visa" in str_str
         assert "12/30" in str_str
 
@@ -1,7 +1,14 @@
 """Tests for the utils module."""
 
 import pytest
-from ccparser.utils import detect_card_type, CARD_TYPE_PATTERNS
+from ccparser.utils import (
+    detect_card_type,
+    get_card_details,
+    clear_bin_cache,
+    prune_bin_cache,
+    CARD_TYPE_PATTERNS,
+    _strip_non_digits,
+)
 
 
 class TestDetectCardType:
@@ -68,6 +75,57 @@ class TestDetectCardType:
         expected_types = {"Visa", "MasterCard", "AMEX", "Discover", "JCB", "Diners Club", "UnionPay"}
         assert set(CARD_TYPE_PATTERNS.keys()) == expected_types
 
+    def test_matches_first_individual_pattern(self):
+        """Test that detection agrees with matching each pattern in order."""
+        import re
+        numbers = [
+            "4111111111111111", "4222222222222", "5500000000000004", "378282246310005",
+            "6011111111111117", "3530111333300000", "213100000000000", "30569309025904",
+            "6212345678901234567", "1234567890123456", "36", "",
+            "411111111111111\u0661", "\u0664111111111111111", "34484\u0661853\t412418",
+        ]
+        for number in numbers:
+            expected = next(
+                (name for name, pattern in CARD_TYPE_PATTERNS.items() if re.match(pattern, number)),
+                "Unknown"
+            )
+            assert detect_card_type(number) == expected
+
+    def test_every_prefix_matches_patterns(self):
+        """Test detection against the patterns for every 4-digit prefix and card length."""
+        import re
+        compiled = [(name, re.compile(pattern)) for name, pattern in CARD_TYPE_PATTERNS.items()]
+        for prefix in range(10000):
+            for length in range(13, 20):
+                number = f"{prefix:04d}".ljust(length, "7")
+                expected = next(
+                    (name for name, pattern in compiled if pattern.match(number)), "Unknown"
+                )
+                assert detect_card_type(number) == expected
+
+
+class TestStripNonDigits:
+    """Tests for _strip_non_digits helper."""
+
+    def test_strips_separators(self):
+        """Test that spaces, dashes and dots are removed."""
+        assert _strip_non_digits("4111 1111-1111.1111") == "4111111111111111"
+
+    def test_no_digits(self):
+        """Test that a string without digits gives an empty string."""
+        assert _strip_non_digits("abc") == ""
+
+    def test_matches_regex_outside_latin1(self):
+        """Test that characters beyond Latin-1 are handled like \\D."""
+        import re
+
+        value = "4111\u2013\u0661\u0662 \u4e00\uff11"
+        assert _strip_non_digits(value) == re.sub(r"\D", "", value)
+
+    def test_latin1_non_decimal_digits_removed(self):
+        """Test that characters such as superscript digits are stripped like \\D."""
+        assert _strip_non_digits("4111\u00b2\u00b3\u00b91111") == "41111111"
+
 
 class TestGetCardDetails:
     """Tests for get_card_details function.
@@ -99,3 +157,184 @@ class TestGetCardDetails:
             assert result is None
         except ImportError:
             pytest.skip("requests library not installed")
+
+
+class _FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, status_code, data=None):
+        self.status_code = status_code
+        self._data = data
+
+    def json(self):
+        return self._data
+
+    def raise_for_status(self):
+        import requests
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(str(self.status_code))
+
+
+class _FakeSession:
+    """Session stub that records requested URLs and returns queued responses."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.urls = []
+
+    def get(self, url, timeout):
+        self.urls.append(url)
+        return self.responses.pop(0)
+
+
+class TestBinLookupCache:
+    """Tests for BIN lookup caching and session reuse."""
+
+    @pytest.fixture
+    def fake_session(self, monkeypatch, tmp_path):
+        pytest.importorskip("requests")
+        from ccparser import utils
+        monkeypatch.setattr(utils, "_BIN_DB_PATH", tmp_path / "bins.db")
+
+        def install(*responses):
+            session = _FakeSession(*responses)
+            monkeypatch.setattr(utils, "_session", session)
+            return session
+
+        clear_bin_cache()
+        yield install
+        clear_bin_cache()
+
+    def test_repeated_bin_is_cached(self, fake_session):
+        """Test that a BIN is fetched once for cards sharing it."""
+        session = fake_session(_FakeResponse(200, {"scheme": "visa", "type": "credit"}))
+        first = get_card_details("4111111111111111")
+        second = get_card_details("4111112222222222")
+        assert first == second
+        assert first['scheme'] == "visa"
+        assert first['bin'] == "Credit"
+        assert session.urls == ["https://lookup.binlist.net/411111"]
+
+    def test_cached_result_is_copied(self, fake_session):
+        """Test that modifying a returned result does not affect the cache."""
+        fake_session(_FakeResponse(200, {"scheme": "visa"}))
+        get_card_details("4111111111111111")['scheme'] = "changed"
+        assert get_card_details("4111111111111111")['scheme'] == "visa"
+
+    def test_rate_limited_is_not_cached(self, fake_session):
+        """Test that a rate-limited lookup is retried on the next call."""
+        session = fake_session(_FakeResponse(429), _FakeResponse(200, {"scheme": "visa"}))
+        assert get_card_details("4111111111111111") is None
+        assert get_card_details("4111111111111111")['scheme'] == "visa"
+        assert len(session.urls) == 2
+
+    def test_clear_bin_cache(self, fake_session):
+        """Test that clearing the cache forces a new lookup."""
+        session = fake_session(_FakeResponse(404), _FakeResponse(404))
+        assert get_card_details("4111111111111111") is None
+        assert get_card_details("4111111111111111") is None
+        clear_bin_cache()
+        assert get_card_details("4111111111111111") is None
+        assert len(session.urls) == 2
+
+    def test_session_retries_server_errors_only(self, monkeypatch):
+        """Test that the session retries 5xx responses but not timeouts or connection errors."""
+        pytest.importorskip("requests")
+        from ccparser import utils
+        monkeypatch.setattr(utils, "_session", None)
+        retry = utils._get_session().get_adapter("https://lookup.binlist.net/").max_retries
+        assert retry.connect == 0
+        assert retry.read == 0
+        assert 503 in retry.status_forcelist
+
+    def test_cache_ignores_timeout(self, fake_session):
+        """Test that lookups with different timeouts share cached results."""
+        session = fake_session(_FakeResponse(200, {"scheme": "visa"}))
+        get_card_details("4111111111111111", timeout=5)
+        assert get_card_details("4111111111111111", timeout=10)['scheme'] == "visa"
+        assert len(session.urls) == 1
+
+    def test_memory_cache_is_bounded(self, fake_session, monkeypatch):
+        """Test that the least recently used BIN is evicted when the cache is full."""
+        from ccparser import utils
+        monkeypatch.setattr(utils, "_BIN_CACHE_SIZE", 2)
+        fake_session(*[_FakeResponse(404) for _ in range(3)])
+        for card_number in ["4111111111111111", "4222221111111111", "4333331111111111"]:
+            get_card_details(card_number)
+        assert list(utils._bin_cache) == ["422222", "433333"]
+
+    def test_disk_cache_survives_memory_cache(self, fake_session):
+        """Test that results persisted on disk are reused without a request."""
+        from ccparser.utils import _bin_cache
+        session = fake_session(_FakeResponse(200, {"scheme": "visa"}))
+        get_card_details("4111111111111111")
+        _bin_cache.clear()
+        assert get_card_details("4111111111111111")['scheme'] == "visa"
+        assert len(session.urls) == 1
+
+    def test_stale_disk_entries_are_refetched_and_pruned(self, fake_session, monkeypatch):
+        """Test that entries older than the maximum age are ignored and pruned."""
+        import time
+        from ccparser.utils import _bin_cache
+        session = fake_session(_FakeResponse(404), _FakeResponse(200, {"scheme": "visa"}))
+        get_card_details("4111111111111111")
+        _bin_cache.clear()
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 31 * 86400)
+        assert get_card_details("4111111111111111")['scheme'] == "visa"
+        assert len(session.urls) == 2
+        monkeypatch.setattr(time, "time", lambda: now + 62 * 86400)
+        assert prune_bin_cache() == 1
+
+    def test_clear_and_prune_do_not_create_cache_file(self, fake_session):
+        """Test that clearing or pruning a missing on-disk cache leaves it missing."""
+        from ccparser import utils
+        clear_bin_cache()
+        assert prune_bin_cache() == 0
+        assert not utils._BIN_DB_PATH.exists()
+
+    def test_deleted_cache_file_is_recreated(self, fake_session):
+        """Test that lookups recreate the on-disk cache if its file is deleted."""
+        from ccparser import utils
+        session = fake_session(
+            _FakeResponse(200, {"scheme": "visa"}), _FakeResponse(200, {"scheme": "visa"})
+        )
+        get_card_details("4111111111111111")
+        utils._BIN_DB_PATH.unlink()
+        utils._bin_cache.clear()
+        get_card_details("4111111111111111")
+        utils._bin_cache.clear()
+        assert get_card_details("4111111111111111")['scheme'] == "visa"
+        assert len(session.urls) == 2
+
+    def test_cache_path_follows_xdg_cache_home(self, monkeypatch, tmp_path):
+        """Test that the on-disk cache is placed under $XDG_CACHE_HOME when set."""
+        from ccparser import utils
+        monkeypatch.setattr(utils, "_BIN_DB_PATH", None)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert utils._bin_db_path() == tmp_path / "ccparser" / "bins.db"
+
+    def test_no_home_directory_disables_disk_cache(self, fake_session, monkeypatch):
+        """Test that lookups still work when there is no home directory for the cache."""
+        from pathlib import Path
+        from ccparser import utils
+
+        def no_home():
+            raise RuntimeError("Could not determine home directory.")
+
+        monkeypatch.setattr(utils, "_BIN_DB_PATH", None)
+        monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+        monkeypatch.setattr(Path, "home", staticmethod(no_home))
+        session = fake_session(_FakeResponse(200, {"scheme": "visa"}))
+        assert get_card_details("4111111111111111")['scheme'] == "visa"
+        assert prune_bin_cache() == 0
+        assert len(session.urls) == 1
+
+    def test_missing_sqlite3_disables_disk_cache(self, fake_session, monkeypatch):
+        """Test that lookups still work without the sqlite3 module."""
+        from ccparser import utils
+        monkeypatch.setattr(utils, "_sqlite3", None)
+        monkeypatch.setattr(utils, "_sqlite3_missing", True)
+        fake_session(_FakeResponse(200, {"scheme": "visa"}))
+        assert get_card_details("4111111111111111")['scheme'] == "visa"
+        assert not utils._BIN_DB_PATH.exists()
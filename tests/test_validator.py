@@ -1,47 +1,105 @@
 """Tests for the validator module."""
 
 import pytest
-from ccparser.validator import validate_card_number, validate_expiry_date, validate_cvv
+from ccparser import validator
+from ccparser.validator import (
+    expected_cvv_length,
+    luhn_check_digit,
+    validate_card,
+    validate_card_number,
+    validate_card_numbers,
+    validate_expiry_date,
+    validate_cvv,
+)
+
+
+# Card numbers and whether each passes validate_card_number
+CARD_NUMBER_CASES = [
+    pytest.param("4111111111111111", True, id="valid-visa"),
+    pytest.param("5500000000000004", True, id="valid-mastercard"),
+    pytest.param("378282246310005", True, id="valid-amex"),
+    pytest.param("4222222222222", True, id="valid-13-digit"),
+    pytest.param("30569309025904", True, id="valid-14-digit"),
+    pytest.param("6212345678901234569", True, id="valid-19-digit"),
+    # All zeros actually passes Luhn!
+    pytest.param("0000000000000000", True, id="all-zeros"),
+    pytest.param("4111111111111112", False, id="invalid-luhn"),
+    pytest.param("378282246310006", False, id="invalid-luhn-amex"),
+    pytest.param("6212345678901234567", False, id="invalid-luhn-19-digit"),
+    pytest.param("", False, id="empty"),
+    pytest.param("4111ABCD11111111", False, id="non-numeric"),
+    pytest.param("4111 1111 1111 1111", False, id="spaces"),
+    pytest.param("\u0664111111111111111", False, id="non-ascii-digit"),
+    # Luhn-valid, but outside 13-19 digits
+    pytest.param("0", False, id="too-short-1"),
+    pytest.param("424242424242", False, id="too-short-12"),
+    pytest.param("42424242424242424242", False, id="too-long-20"),
+]
 
 
 class TestValidateCardNumber:
     """Tests for validate_card_number function."""
 
-    def test_valid_visa(self):
-        """Test valid Visa card number."""
-        assert validate_card_number("4111111111111111") is True
+    @pytest.mark.parametrize("card_number, expected", CARD_NUMBER_CASES)
+    def test_card_numbers(self, card_number, expected):
+        """Test each card number in CARD_NUMBER_CASES."""
+        assert validate_card_number(card_number) is expected
 
-    def test_valid_mastercard(self):
-        """Test valid MasterCard number."""
-        assert validate_card_number("5500000000000004") is True
+    def test_none_value(self):
+        """Test None value returns False."""
+        assert validate_card_number(None) is False
 
-    def test_valid_amex(self):
-        """Test valid AMEX card number."""
-        assert validate_card_number("378282246310005") is True
+    def test_non_string_value(self):
+        """Test that a number given as an int returns False."""
+        assert validate_card_number(4111111111111111) is False
 
-    def test_invalid_luhn(self):
-        """Test card number that fails Luhn check."""
-        assert validate_card_number("4111111111111112") is False
 
-    def test_all_zeros(self):
-        """Test that all zeros fails validation."""
-        assert validate_card_number("0000000000000000") is True  # Actually passes Luhn!
+class TestValidateCardNumbers:
+    """Tests for validate_card_numbers function."""
 
-    def test_empty_string(self):
-        """Test empty string returns False."""
-        assert validate_card_number("") is False
+    @pytest.fixture(params=["numpy", "fallback"])
+    def backend(self, request, monkeypatch):
+        if request.param == "numpy":
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(validator, "_get_numpy", lambda: None)
+        return request.param
 
-    def test_non_numeric(self):
-        """Test non-numeric string returns False."""
-        assert validate_card_number("4111ABCD11111111") is False
+    def test_card_number_cases(self, backend):
+        """Test all of CARD_NUMBER_CASES, plus non-strings, in one batch."""
+        numbers = [case.values[0] for case in CARD_NUMBER_CASES] + [None, 4111111111111111]
+        expected = [case.values[1] for case in CARD_NUMBER_CASES] + [False, False]
+        assert validate_card_numbers(numbers) == expected
 
-    def test_with_spaces(self):
-        """Test string with spaces returns False."""
-        assert validate_card_number("4111 1111 1111 1111") is False
+    def test_single_length(self, backend):
+        """Test numbers that all have the same length."""
+        numbers = [
+            "4111111111111111",
+            "4111111111111112",
+            "5500000000000004",
+            "4111ABCD11111111",
+            "\u0664111111111111111",
+        ]
+        assert validate_card_numbers(numbers) == [True, False, True, False, False]
+        assert validate_card_numbers(numbers[:4]) == [True, False, True, False]
 
-    def test_none_value(self):
-        """Test None value returns False."""
-        assert validate_card_number(None) is False
+    def test_empty_input(self, backend):
+        """Test that no numbers gives an empty list."""
+        assert validate_card_numbers([]) == []
+
+    def test_accepts_iterables(self, backend):
+        """Test that any iterable of numbers is accepted."""
+        numbers = (number for number in ["4111111111111111", "378282246310006"])
+        assert validate_card_numbers(numbers) == [True, False]
+
+
+class TestLuhnCheckDigit:
+    """Tests for luhn_check_digit function."""
+
+    @pytest.mark.parametrize("card_number", ["4111111111111111", "378282246310005", "30569309025904"])
+    def test_completes_valid_numbers(self, card_number):
+        """Test that the check digit of a valid number is its last digit."""
+        assert luhn_check_digit(card_number[:-1]) == int(card_number[-1])
 
 
 class TestValidateExpiryDate:
@@ -67,6 +125,30 @@ class TestValidateExpiryDate:
         """Test January month handling."""
         assert validate_expiry_date("01", "2030") is True
 
+    def test_current_month_valid(self):
+        """Test that a card is valid through its expiry month."""
+        import datetime
+        today = datetime.date.today()
+        assert validate_expiry_date(str(today.month), str(today.year)) is True
+
+    def test_previous_month_invalid(self):
+        """Test that a card expiring last month is invalid."""
+        import datetime
+        today = datetime.date.today()
+        year, month = (today.year, today.month - 1) if today.month > 1 else (today.year - 1, 12)
+        assert validate_expiry_date(str(month), str(year)) is False
+
+    def test_current_year_month_is_cached(self, monkeypatch):
+        """Test that the date is read at most once a second."""
+        import datetime
+        from ccparser import validator
+        monkeypatch.setattr(validator, "_today_cache", (float("-inf"), (0, 0)))
+        first = validator._current_year_month()
+        assert first == (datetime.date.today().year, datetime.date.today().month)
+        checked_at = validator._today_cache[0]
+        assert validator._current_year_month() == first
+        assert validator._today_cache[0] == checked_at
+
     def test_invalid_month_zero(self):
         """Test month 0 is invalid."""
         assert validate_expiry_date("00", "2030") is False
@@ -135,3 +217,53 @@ class TestValidateCVV:
     def test_cvv_with_spaces(self):
         """Test CVV with spaces returns False."""
         assert validate_cvv("1 2 3", "4111111111111111") is False
+
+    def test_non_ascii_digits(self):
+        """Test that digits outside 0-9 are rejected, as the parser does."""
+        assert validate_cvv("\u0661\u0662\u0663", "4111111111111111") is False
+
+    def test_non_ascii_card_number_is_not_amex(self):
+        """Test that a card number with non-ASCII digits needs a 3-digit CVV."""
+        assert validate_cvv("412", "34484\u0661853\t412418") is True
+
+    def test_card_type_override(self):
+        """Test that a known card type is used instead of detecting it."""
+        assert validate_cvv("1234", "4111111111111111", card_type="AMEX") is True
+        assert validate_cvv("123", "378282246310005", card_type="Visa") is True
+
+    def test_wrong_length_skips_detection(self, monkeypatch):
+        """Test that CVVs of a length no card uses are rejected before detection."""
+        def fail(card_number):
+            raise AssertionError("card type should not be detected")
+        monkeypatch.setattr(validator, "detect_card_type", fail)
+        assert validate_cvv("12", "378282246310005") is False
+        assert validate_cvv("12345", "4111111111111111") is False
+
+
+class TestValidateCard:
+    """Tests for validate_card function."""
+
+    def test_valid_card(self):
+        """Test that a card passing all three checks is valid."""
+        assert validate_card("4111111111111111", "12", "2030", "123") is True
+        assert validate_card("378282246310005", "12", "30", "1234") is True
+
+    def test_each_check_applies(self):
+        """Test that failing any one check makes the card invalid."""
+        assert validate_card("4111111111111112", "12", "2030", "123") is False
+        assert validate_card("4111111111111111", "01", "2020", "123") is False
+        assert validate_card("4111111111111111", "12", "2030", "1234") is False
+
+    def test_short_year_forms(self):
+        """Test that years below 100 are read as 20YY, like validate_expiry_date."""
+        assert validate_card("4111111111111111", "12", "0030", "123") is True
+
+    def test_card_type_override(self):
+        """Test that a known card type is used for the CVV length."""
+        assert validate_card("4111111111111111", "12", "2030", "1234", card_type="AMEX") is True
+
+    def test_expected_cvv_length(self):
+        """Test the CVV length for each card type."""
+        assert expected_cvv_length("AMEX") == 4
+        assert expected_cvv_length("Visa") == 3
+        assert expected_cvv_length("Unknown") == 3